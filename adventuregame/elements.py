@@ -10,64 +10,164 @@ implements.
 """
 
 import abc
-import collections
-import math
+import array
+import operator
 import random
 import re
+import sys
 
 import adventuregame.exceptions as excpt
-import adventuregame.utility as util
 
 
 __name__ = 'adventuregame.elements'
 
 
+# These two module-level constants are used by _coerce_ini_str() to coerce .ini
+# values to their python types. The dict maps lowercased boolean strings to
+# booleans, so 'true', 'True' and 'TRUE' are all recognized, and the regular
+# expression classifies a numeric string in a single match: if no group
+# captured it's an int, otherwise it has a decimal point or an exponent and is
+# a float (the forms '5.', '.5', '5.5' and '5e-1' are all accepted).
+# Matching first means float() is only ever called on strings it can parse.
+_BOOL_MAP = {'true': True, 'false': False}
+
+_NUM_RE = re.compile(r'[+-]?(?:[0-9]+(\.[0-9]*)?|(\.[0-9]+))([eE][+-]?[0-9]+)?$')
+
+
+def _coerce_ini_str(value):
+    """
+This function coerces a string value from an .ini file to its python type, as
+Ini_Entry.__init__ does: 'true' and 'false' in any case become booleans, integer
+strings become ints, float strings become floats, and any other string is
+returned unchanged.
+
+:value:  A string.
+:return: A boolean, an int, a float, or a string.
+    """
+    bool_value = _BOOL_MAP.get(value.lower())
+    if bool_value is not None:
+        return bool_value
+    number_match = _NUM_RE.match(value)
+    if number_match:
+        return float(value) if number_match.lastindex else int(value)
+    return value
+
+
+def _ini_flag(value):
+    """
+This function returns the truth value of an .ini flag such as is_entrance. A
+string is coerced as Ini_Entry.__init__ would coerce it first, so 'false' and
+'0' are False; a missing (None) value is False.
+
+:value:  A string, or a value Ini_Entry.__init__ has already coerced.
+:return: A boolean.
+    """
+    return bool(_coerce_ini_str(value) if isinstance(value, str) else value)
+
+
+# This dict is used by Equippable_Item.usable_by to map a character class to the
+# name of the {class}_can_use attribute that records whether it can use an item.
+_USABLE_ATTR = {'Warrior': 'warrior_can_use', 'Thief': 'thief_can_use', 'Mage': 'mage_can_use',
+                'Priest': 'priest_can_use'}
+
+# This regular expression is used to parse the contents= attributes used by
+# rooms.ini and containers.ini to encode initializing data for an
+# Items_Multi_State object into a single line of text. Used in
+# Ini_Entry._process_list_value(), which checks the enclosing brackets and then
+# tokenizes the quantity/internal name pairs with one findall() pass.
+_INVENTORY_RE = re.compile(r'([1-9][0-9]*)x([A-Z][A-Za-z_]+)')
+
+# The Equipment attributes that an item can be equipped to. Because each name is
+# also the attribute it's stored in, Equipment._equip and _unequip can validate
+# the slot name and then setattr() it directly.
+_EQUIP_SLOTS = frozenset(('armor', 'shield', 'weapon', 'wand'))
+
+# The names of the six ability scores, in their conventional order.
+_ABILITY_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+# These are the indexes of the six ability scores in Ability_Scores' array.
+_STR, _DEX, _CON, _INT, _WIS, _CHA = range(6)
+
+# The order of priority that each character class assigns rolled ability scores
+# in, used by Ability_Scores.roll_stats.
+_WEIGHTINGS = {
+    'Warrior': ('strength', 'constitution', 'dexterity', 'intelligence', 'charisma', 'wisdom'),
+    'Thief': ('dexterity', 'constitution', 'charisma', 'strength', 'wisdom', 'intelligence'),
+    'Priest': ('wisdom', 'strength', 'constitution', 'charisma', 'intelligence', 'dexterity'),
+    'Mage': ('intelligence', 'dexterity', 'constitution', 'strength', 'wisdom', 'charisma')
+}
+
+# This dict maps each character class to the rank, in its weightings, of each
+# ability score taken in _ABILITY_NAMES order, so that Ability_Scores.roll_stats
+# can place a descending list of rolls straight into its scores array.
+_WEIGHTING_RANKS = {character_class: tuple(weighting.index(ability_score) for ability_score in _ABILITY_NAMES)
+                    for character_class, weighting in _WEIGHTINGS.items()}
+
+# The rules for "mana" points I use in the Character class are drawn from
+# Dungeons & Dragons 3rd edition rules. In those rules they're called "spell
+# points". These two tables are drawn from the variant Spell Points rules, which
+# are available online at <http://dndsrd.net/unearthedSpellPoints.html>. The
+# bonus mana points table is indexed by the magic key stat modifier plus 4, so it
+# covers the modifiers -4 through 4.
+_BASE_MANA_POINTS = {'Priest': 16, 'Mage': 19}
+
+_BONUS_MANA_POINTS = (0, 0, 0, 0, 0, 1, 4, 9, 16)
+# End data from that page.
+
+# These defaults are adapted from D&D 3rd edition rules. This info is generic
+# and doesn't have a citation.
+_MAGIC_KEY_STATS = {'Priest': 'wisdom', 'Mage': 'intelligence'}
+# End rules drawn from D&D.
+
+# These are arbitrary.
+_HITPOINT_BASE = {'Warrior': 40, 'Priest': 30, 'Thief': 30, 'Mage': 20}
+
+
 class Ini_Entry(object):
     """
 This class is the parent class for classes like Room, Item, and Door that are
 instantiated from .ini file entries.
     """
+    __slots__ = ()
 
-    # This regular expression is used to parse the contents= attributes
-    # used by rooms.ini and containers.ini to encode initializing data
-    # for an Items_Multi_State object into a single line of text. Used in
-    # Ini_Entry._process_list_value().
-    inventory_list_value_re = re.compile(r"""^\[(
-                                                    (
-                                                        [1-9][0-9]*
-                                                        x
-                                                        [A-Z][A-Za-z_]+
-                                                    )(,
-                                                        [1-9][0-9]*
-                                                        x
-                                                        [A-Z][A-Za-z_]+
-                                                    )*
-                                                )\]$""", re.X)
+    # Ini_Entry itself declares no attributes; __init_subclass__ sets this on
+    # each subclass to the full tuple of slot attributes it carries.
+    _ini_slots = ()
 
     def __init__(self, **argd):
         """
 The init method defined in this parent class accepts arbitrary keyword arguments
-and parses them .ini format. Values 'true' and 'false' are cast to boolean,
-integer strings are cast to int ands float strings are cast to float. All
+and parses them .ini format. Values 'true' and 'false', in any case, are cast to
+boolean, integer strings are cast to int ands float strings are cast to float. Every
+attribute listed in the class's _ini_slots is first set to None, and then all
 entries in **argd are assigned to object attributes.
         """
-        for Key, value in argd.items():
+        for key in self._ini_slots:
+            setattr(self, key, None)
+        for key, value in argd.items():
             if isinstance(value, str):
-                if value.lower() == 'false':
-                    value = False
-                elif value.lower() == 'true':
-                    value = True
-                elif value.isdigit():
-                    value = int(value)
-                elif util.isfloat(value):
-                    value = float(value)
-            setattr(self, Key, value)
+                value = _coerce_ini_str(value)
+            setattr(self, key, value)
+
+    def __init_subclass__(cls, **argd):
+        """
+This hook collects the __slots__ of every Ini_Entry class in the subclass's MRO
+into the _ini_slots tuple, so that leaf subclasses which declare empty __slots__
+still know the full set of attributes they carry. It also builds an attrgetter
+over those attributes that __eq__ uses to fetch them all in a single call.
+        """
+        super().__init_subclass__(**argd)
+        cls._ini_slots = tuple(dict.fromkeys(slot for klass in reversed(cls.__mro__) if issubclass(klass, Ini_Entry)
+                                             for slot in klass.__dict__.get('__slots__', ())))
+        if cls._ini_slots:
+            cls._attrgetter = operator.attrgetter(*cls._ini_slots)
 
     def __eq__(self, other):
         """
 This method enables two Ini_Entry objects or Ini_Entry subclass objects to be
-tested for equality. It draws on __slots__ and checks each attribute's value in
-self and other for equality. Only if all attributes match is True returned.
+tested for equality. It draws on the class's _attrgetter to fetch every slot
+attribute of self and other, and compares the results. Only if all attributes
+match is True returned.
 
 :other:  The other object to compare against.
 :return: True or False.
@@ -75,20 +175,7 @@ self and other for equality. Only if all attributes match is True returned.
         if not isinstance(other, type(self)):
             return False
         else:
-            return all(getattr(self, attr, None) == getattr(other, attr, None) for attr in self.__slots__)
-
-    def _post_init_slots_set_none(self, slots):
-        """
-This private method is used by Ini_Entry subclasses to finish up their
-__init__'s attribute setting by traversing __slots__ and setting every attribute
-that remained unset to None explicitly.
-
-:slots:   The __slots__ value of the class the method is being called from.
-:returns: None.
-        """
-        for key in slots:
-            if not hasattr(self, key):
-                setattr(self, key, None)
+            return self._attrgetter(self) == self._attrgetter(other)
 
     def _process_list_value(self, inventory_value):
         r"""
@@ -104,11 +191,10 @@ the quantities referrred to.
                   \[\d+x[A-Z][A-Za-z_]+(,\d+[A-Z][A-Za-z_]+)*\].
 :return:          A tuple of pairs of quantity ints and Item subclass objects.
         """
-        value_match = self.inventory_list_value_re.match(inventory_value)
-        inner_capture = value_match.groups(1)[0]
-        capture_split = inner_capture.split(',')
-        qty_strval_pairs = tuple((int(item_qty), item_name) for item_qty, item_name in (
-                                    name_x_qty_str.split('x', maxsplit=1) for name_x_qty_str in capture_split))
+        if not (inventory_value.startswith('[') and inventory_value.endswith(']')):
+            raise excpt.Internal_Exception(f'unable to parse item list value {inventory_value}')
+        qty_strval_pairs = tuple((int(item_qty), item_name) for item_qty, item_name in
+                                 _INVENTORY_RE.findall(inventory_value))
         return qty_strval_pairs
 
 
@@ -130,8 +216,7 @@ present in the private dictionary.
 :item_internal_name: The internal name of the Item subclass object.
 :return:             True or False.
         """
-        return any(item_internal_name == contained_item.internal_name
-                   for contained_item in self._contents.values())
+        return item_internal_name in self._contents
 
     def get(self, item_internal_name):  # check
         """
@@ -143,6 +228,17 @@ present, otherwise the internal dict raises a KeyError.
         """
         return self._contents[item_internal_name]
 
+    def try_get(self, item_internal_name):
+        """
+This accessor method returns the object with the given internal name if
+present, otherwise None. It stands in for a contains() call followed by a get()
+call, with one dict probe instead of two.
+
+:item_internal_name: The internal name of the object.
+:return:             The stored object, or None.
+        """
+        return self._contents.get(item_internal_name)
+
     def set(self, item_internal_name, item):  # check
         """
 This setter method adds an item to the internal dictionary using the given
@@ -208,19 +304,6 @@ dict-of-dicts sections attribute.
                  'item_type', 'warrior_can_use', 'thief_can_use', 'priest_can_use', 'mage_can_use',
                  'hit_points_recovered', 'mana_points_recovered')
 
-    def __init__(self, **argd):
-        """
-The Item class's __init__ method accepts arbitrary key-value pairs via **argd
-and uses super() to have Ini_Entry.__init__ set them. Afterwards, it uses
-_post_init_slots_set_none to set every remaining attribute listed in __slots__
-to None explicitly.
-
-:**argd: Key-value pairs to set as attributes on the object.
-:return: None.
-        """
-        super().__init__(**argd)
-        self._post_init_slots_set_none(self.__slots__)
-
     @classmethod
     def subclassing_factory(self, **item_dict):
         """
@@ -235,28 +318,39 @@ solely so that an Item object can be type-tested to detect its category.
               object with.
 :return:      An Item subclass object.
         """
-        if item_dict['item_type'] == 'armor':
-            item = Armor(**item_dict)
-        elif item_dict['item_type'] == 'coin':
-            item = Coin(**item_dict)
-        elif item_dict['item_type'] == 'potion':
-            item = Potion(**item_dict)
-        elif item_dict['item_type'] == 'key':
-            item = Key(**item_dict)
-        elif item_dict['item_type'] == 'shield':
-            item = Shield(**item_dict)
-        elif item_dict['item_type'] == 'wand':
-            item = Wand(**item_dict)
-        elif item_dict['item_type'] == 'weapon':
-            item = Weapon(**item_dict)
-        elif item_dict['item_type'] == 'oddment':
-            item = Oddment(**item_dict)
-        else:
+        item_class = _ITEM_CLASSES.get(item_dict['item_type'])
+        if item_class is None:
             raise excpt.Internal_Exception(f"couldn't instance Item subclass, unrecognized item type '{item_dict['item_type']}.")
-        return item
+        return item_class(**item_dict)
 
 
 class Equippable_Item(Item):
+    # The damage string of a weapon or wand is split into its dice and its int
+    # modifier once at load time, so Character.damage_roll doesn't have to parse
+    # it on every attack. Both are None for items without a damage value.
+    __slots__ = '_damage_dice', '_damage_mod'
+
+    def __init__(self, **argd):
+        r"""
+The __init__ method uses super() to call Ini_Entry.__init__ to populate the
+object with attributes from argd. It then parses the damage attribute, if any,
+which has the form '\d+d\d+([+-]\d+)?', into the _damage_dice and _damage_mod
+attributes.
+
+:**argd: The key-value pairs to initialize the Equippable_Item object with.
+        """
+        super().__init__(**argd)
+        damage = self.damage
+        if damage is None:
+            return
+        elif '+' in damage:
+            self._damage_dice, _, damage_mod = damage.partition('+')
+            self._damage_mod = int(damage_mod)
+        elif '-' in damage:
+            self._damage_dice, _, damage_mod = damage.partition('-')
+            self._damage_mod = -int(damage_mod)
+        else:
+            self._damage_dice, self._damage_mod = damage, 0
 
     def usable_by(self, character_class):
         """
@@ -269,9 +363,10 @@ value, or False otherwise.
 :character_class: Either 'Warrior', 'Thief', 'Mage', or 'Priest'.
 :return:          A boolean.
         """
-        if character_class not in ('Warrior', 'Thief', 'Mage', 'Priest'):
+        usable_attr = _USABLE_ATTR.get(character_class)
+        if usable_attr is None:
             raise excpt.Internal_Exception(f'character class {character_class} not recognized')
-        return bool(getattr(self, character_class.lower() + '_can_use', None))
+        return bool(getattr(self, usable_attr))
 
 
 # The subclasses don't have much differing functionality but accurately typing each Item allows classes that handle
@@ -283,7 +378,7 @@ This Equippable_Item subclass is used to represent items which are suits of
 armor. It offers no functionality, but is useful for detecting armor items by
 type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Coin(Item):
@@ -291,7 +386,7 @@ class Coin(Item):
 This Item subclass is used to represent items which are suits of armor. It
 offers no functionality, but is useful for detecting coin items by type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Potion(Item):
@@ -300,7 +395,7 @@ This Item subclass is used to represent items which are suits of armor. It
 offers no functionality, but is useful for detecting potion items by type
 testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Key(Item):
@@ -308,7 +403,7 @@ class Key(Item):
 This Item subclass is used to represent items which are suits of armor. It
 offers no functionality, but is useful for detecting key items by type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Oddment(Item):
@@ -317,7 +412,7 @@ This Item subclass is used to represent items that are miscellaneous goods with
 no in-game purpose. It offers no functionality, but is useful for detecting key
 items by type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Shield(Equippable_Item):
@@ -326,7 +421,7 @@ This Equippable_Item subclass is used to represent items which are suits of
 armor. It offers no functionality, but is useful for detecting shield items by
 type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Wand(Equippable_Item):
@@ -335,7 +430,7 @@ This Equippable_Item subclass is used to represent items which are suits of
 armor. It offers no functionality, but is useful for detecting wand items by
 type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Weapon(Equippable_Item):
@@ -344,7 +439,13 @@ This Equippable_Item subclass is used to represent items which are suits of
 armor. It offers no functionality, but is useful for detecting weapon items by
 type testing.
     """
-    pass
+    __slots__ = ()
+
+
+# This lookup table is used by Item.subclassing_factory to select the Item
+# subclass to instantiate from an items.ini entry's item_type value.
+_ITEM_CLASSES = {'armor': Armor, 'coin': Coin, 'potion': Potion, 'key': Key, 'shield': Shield, 'wand': Wand,
+                 'weapon': Weapon, 'oddment': Oddment}
 
 
 class Items_State(State):
@@ -353,6 +454,7 @@ This subclass of the abstract base class State represents a container object
 which stores Item objects. It's initialized with a **dict-of-dicts from the
 items.ini IniConfig object.
     """
+    __slots__ = ()
 
     def __init__(self, **dict_of_dicts):
         """
@@ -365,10 +467,13 @@ internal_name set to the corresponding key from the outer dict.
                   which are key-value pairs to initialize an individual Item
                   subclass object with.
         """
-        self._contents = dict()
-        for item_internal_name, item_dict in dict_of_dicts.items():
-            item = Item.subclassing_factory(internal_name=item_internal_name, **item_dict)
-            self._contents[item_internal_name] = item
+        # Each items.ini entry is passed to the Item subclassing factory under its
+        # internal name. Internal names are dict keys for every later lookup, so
+        # I intern them once here to let those lookups match by identity.
+        item_factory = Item.subclassing_factory
+        self._contents = {item_internal_name: item_factory(internal_name=item_internal_name, **item_dict)
+                          for item_internal_name, item_dict in zip(map(sys.intern, dict_of_dicts.keys()),
+                                                                   dict_of_dicts.values())}
 
 
 class Items_Multi_State(Items_State):
@@ -376,46 +481,119 @@ class Items_Multi_State(Items_State):
 This subclass of Items_State extends its functionality to track the quantity of
 each Item subclass object it contains.
     """
+    # The Item subclass objects are kept in the _contents dict like Items_State
+    # does, and their quantities in a parallel _qty dict under the same internal
+    # names, so changing a quantity doesn't allocate a new tuple.
+    __slots__ = '_qty',
 
     def __init__(self, **argd):
         """
-The __init__ method of this class uses super() to call Items_State.__init__()
-with the **dict-of-dicts argd. It then resets each key's value to a tuple
-of the quantity 1 and the Item subclass object. Quantities can be
-altered with subsequent method use but setting quantities above 1 in
-Items_Multi_State.__init__ is not supported.
+The __init__ method of this class accepts a **dict-of-dicts argd like
+Items_State.__init__() does, and stores each Item subclass object with the
+quantity 1. Quantities can be altered with subsequent method use but setting
+quantities above 1 in Items_Multi_State.__init__ is not supported.
         """
-        super().__init__(**argd)
+        item_factory = Item.subclassing_factory
+        self._contents = {item_internal_name: item_factory(internal_name=item_internal_name, **item_dict)
+                          for item_internal_name, item_dict in zip(map(sys.intern, argd.keys()), argd.values())}
+        self._qty = dict.fromkeys(self._contents, 1)
 
-        # I preload the dict's items() sequence outside of the loop because the loop alters the dict and I don't want a
-        # concurrent update error.
-        contents_items = tuple(self._contents.items())
-        for item_internal_name, item in contents_items:
-            self._contents[item_internal_name] = (1, item)
+    def get(self, item_internal_name):
+        """
+If an object with the given internal name is present in the internal dicts,
+this accessor method returns a 2-tuple comprising an int of the item's quantity
+and the Item subclass object; otherwise the internal dict raises a KeyError.
 
-    def contains(self, item_internal_name):
+:item_internal_name: The internal name of the Item subclass object.
+:return:             A 2-tuple of an int and an Item subclass object.
         """
-This method tests whether an item object with the specified internal name is
-present in the private dictionary.
+        return self._qty[item_internal_name], self._contents[item_internal_name]
+
+    def qty_of(self, item_internal_name):
+        """
+This accessor method returns the quantity stored for the given internal name, or
+0 if no such Item subclass object is present. It makes one dict probe where a
+contains() call followed by a get() call would make three.
 
 :item_internal_name: The internal name of the Item subclass object.
-:return:             A boolean.
+:return:             An int.
         """
-        return(any(contained_item.internal_name == item_internal_name
-                   for _, contained_item in self._contents.values()))
+        return self._qty.get(item_internal_name, 0)
+
+    def require(self, item_internal_name):
+        """
+This accessor method returns the Item subclass object with the given internal
+name if present, otherwise it raises an Internal_Exception. It's used where an
+item's absence means the calling code has gone wrong.
+
+:item_internal_name: The internal name of the Item subclass object.
+:return:             An Item subclass object.
+        """
+        try:
+            return self._contents[item_internal_name]
+        except KeyError:
+            raise excpt.Internal_Exception(f'the item `{item_internal_name}` is not present in this '
+                                           '`Items_Multi_State` object') from None
 
     def set(self, item_internal_name, item_qty, item):
         """
-If an object with the given internal name is present in the internal dict, this
-accessor method returns a 2-tuple comprising an int of the item's quantity and
-the Item subclass object; otherwise the internal dict raises a KeyError.
+This setter method stores the given Item subclass object and its quantity
+under the given internal name.
 
 :item_internal_name: The internal name of the Item subclass object.
 :item_qty:           An int value of the item quantity.
 :item:               The Item subclass object.
 :return:             None.
         """
-        self._contents[item_internal_name] = item_qty, item
+        self._contents[item_internal_name] = item
+        self._qty[item_internal_name] = item_qty
+
+    def delete(self, item_internal_name):
+        """
+This method deletes the Item subclass object and its quantity from the
+internal dicts.
+
+:item_internal_name: The internal name of the Item subclass object.
+:returns:            None.
+        """
+        del self._contents[item_internal_name]
+        del self._qty[item_internal_name]
+
+    def values(self):
+        """
+This method is a generator that yields a 2-tuple of quantity and Item subclass
+object for each item stored.
+
+:return: A generator of 2-tuples of an int and an Item subclass object.
+        """
+        qty = self._qty
+        for item_internal_name, item in self._contents.items():
+            yield qty[item_internal_name], item
+
+    def items(self):
+        """
+This method is a generator that yields each internal name paired with a 2-tuple
+of its quantity and Item subclass object.
+
+:return: A generator of 2-tuples of a string and a 2-tuple of an int and an Item
+         subclass object.
+        """
+        qty = self._qty
+        for item_internal_name, item in self._contents.items():
+            yield item_internal_name, (qty[item_internal_name], item)
+
+    def bulk_load(self, items_multi_state):
+        """
+This method stores every Item subclass object held by the given
+Items_Multi_State object, with its quantity, replacing any quantity already
+stored under the same internal name. It copies both internal dicts with
+dict.update() rather than calling set() once per item.
+
+:items_multi_state: An Items_Multi_State object.
+:return:            None.
+        """
+        self._contents.update(items_multi_state._contents)
+        self._qty.update(items_multi_state._qty)
 
     def add_one(self, item_internal_name, item):
         """
@@ -427,11 +605,11 @@ with a quantity of 1.
 :item:               The Item subclass object.
 :return:             None.
         """
-        if self.contains(item_internal_name):
-            self._contents[item_internal_name] = (self._contents[item_internal_name][0] + 1,
-                                                  self._contents[item_internal_name][1])
+        if item_internal_name in self._qty:
+            self._qty[item_internal_name] += 1
         else:
-            self._contents[item_internal_name] = 1, item
+            self._qty[item_internal_name] = 1
+            self._contents[item_internal_name] = item
 
     def remove_one(self, item_internal_name):
         """
@@ -443,13 +621,12 @@ dictionary.
 :item_internal_name: The internal name of the Item subclass object.
 :return:             None.
         """
-        if item_internal_name not in self._contents:
-            raise KeyError(item_internal_name)
-        elif self._contents[item_internal_name][0] == 1:
+        item_qty = self._qty[item_internal_name]
+        if item_qty == 1:
+            del self._qty[item_internal_name]
             del self._contents[item_internal_name]
         else:
-            self._contents[item_internal_name] = (self._contents[item_internal_name][0] - 1,
-                                                  self._contents[item_internal_name][1])
+            self._qty[item_internal_name] = item_qty - 1
 
 
 class Door(Ini_Entry):
@@ -459,20 +636,27 @@ from a single section of a doors.ini file as returned by an IniConfig's
 dict-of-dicts sections attribute.
     """
     __slots__ = ('internal_name', 'title', 'description', 'door_type', 'is_locked', 'is_closed', 'closable',
-                 '_linked_rooms_internal_names', 'is_exit')
+                 '_other', 'is_exit')
 
     def __init__(self, **argd):
         """
 The __init__ method uses super() to call Ini_Entry.__init__ to populate the
-object with attributes from argd. It then sets all unset attributes to None and
+object with attributes from argd (any unset attributes are None). It then
 parses the internal name (which has the form 'Room_#,#_x_Room_#,#') to detect
 which two rooms are joined by this door.
 
 :**argd: The key-value pairs to initialize the Door object with.
         """
         super().__init__(**argd)
-        self._post_init_slots_set_none(self.__slots__)
-        self._linked_rooms_internal_names = set(self.internal_name.split('_x_'))
+        self.internal_name = sys.intern(self.internal_name)
+        # The name holds exactly one '_x_' separator, so splitting stops at the
+        # first match.
+        first_room_internal_name, second_room_internal_name = map(sys.intern, self.internal_name.split('_x_', 1))
+        # Each of the two room names is mapped to the other one, so
+        # other_room_internal_name() is a single dict lookup. Copies of this
+        # Door share the dict, which is never modified.
+        self._other = {first_room_internal_name: second_room_internal_name,
+                       second_room_internal_name: first_room_internal_name}
 
     @classmethod
     def subclassing_factory(self, **door_dict):
@@ -483,15 +667,10 @@ door_type value.
 
 :**door_dict: The key-value pairs to initialize the Door subclass object with.
         """
-        if door_dict['door_type'] == 'doorway':
-            door = Doorway(**door_dict)
-        elif door_dict['door_type'] == 'wooden_door':
-            door = Wooden_Door(**door_dict)
-        elif door_dict['door_type'] == 'iron_door':
-            door = Iron_Door(**door_dict)
-        else:
+        door_class = _DOOR_CLASSES.get(door_dict['door_type'])
+        if door_class is None:
             raise excpt.Internal_Exception(f'unrecognized door type: {door_dict["door_type"]}')
-        return door
+        return door_class(**door_dict)
 
     def other_room_internal_name(self, room_internal_name):
         """
@@ -502,18 +681,11 @@ linkage.
 :room_internal_name: The internal name of a Room object.
 :return:             A Room object.
         """
-
-        if room_internal_name not in self._linked_rooms_internal_names:
-            raise excpt.Internal_Exception(f'room internal name {room_internal_name} not one of the two rooms linked by this'
-                                      ' door object')
-
-        # The _linked_rooms_internal_names set is only 2 elements long and by
-        # the above one of those elements is the name supplied so this loop
-        # returns the other name.
-        for found_internal_name in self._linked_rooms_internal_names:
-            if found_internal_name == room_internal_name:
-                continue
-            return found_internal_name
+        other_room_internal_name = self._other.get(room_internal_name)
+        if other_room_internal_name is not None:
+            return other_room_internal_name
+        raise excpt.Internal_Exception(f'room internal name {room_internal_name} not one of the two rooms linked by this'
+                                       ' door object')
 
     def copy(self):
         """
@@ -521,7 +693,12 @@ This method returns a shallow copy of the object.
 
 :return: A Door object.
         """
-        return self.__class__(**{attr: getattr(self, attr, None) for attr in self.__slots__})
+        # I bypass __init__ so the internal name isn't reparsed; every slot is
+        # always set, so the precomputed attrgetter can fetch them all at once.
+        door_copy = object.__new__(self.__class__)
+        for attr, value in zip(self._ini_slots, self._attrgetter(self)):
+            setattr(door_copy, attr, value)
+        return door_copy
 
 
 class Doorway(Door):
@@ -529,7 +706,7 @@ class Doorway(Door):
 This Door subclass is used to represent doors which are doorways. It offers no
 functionality, but is useful for detecting doorways by type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Wooden_Door(Door):
@@ -537,7 +714,7 @@ class Wooden_Door(Door):
 This Door subclass is used to represent doors which are wooden. It offers no
 functionality, but is useful for detecting wooden doors by type testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Iron_Door(Door):
@@ -545,7 +722,12 @@ class Iron_Door(Door):
 This Door subclass is used to represent doors which are iron. It offers no
 functionality, but is useful for detecting iron doors by type testing.
     """
-    pass
+    __slots__ = ()
+
+
+# This lookup table is used by Door.subclassing_factory to select the Door
+# subclass to instantiate from a doors.ini entry's door_type value.
+_DOOR_CLASSES = {'doorway': Doorway, 'wooden_door': Wooden_Door, 'iron_door': Iron_Door}
 
 
 # This class doesn't subclass `State` because it re-implements every method.
@@ -556,35 +738,33 @@ This class replicates the functionality of the State object for a container
 object which stores Door subclass objects. It's initialized with a **dict-of-dicts
 from the items.ini IniConfig object.
     """
+    __slots__ = '_contents',
 
     def __init__(self, **dict_of_dicts):
         """
-The internal storage dictionary of this object is two-dimensional, indexed by
-the internal names of the two rooms connected by the door. For consistency, the
-two internal names are sorted and the internal name that is earlier in the sort
-order is the outer dict's key, and the one that's later in the sort order is the
-inner dict's key.
+The internal storage dictionary of this object is a single flat dict, indexed by
+2-tuples of the internal names of the two rooms connected by the door. For
+consistency, the two internal names are sorted, so the same Door is found no
+matter which order the two rooms are given in.
 
 :**dict_of_dicts: A structure of internal name keys corresponding to dict values
                   which are key-value pairs to initialize an individual Door
                   object with.
         """
-        self._contents = collections.defaultdict(dict)
         # The entries in doors.ini have internal_names that consist of the
         # internal names for the two rooms they connect, connected by '_x_'.
-        # This loop recovers the two room internal names for each .ini entry and
-        # stores the Door subclass object in a dict-of-dicts under the two room
-        # internal names.
-        for door_internal_name, door_argd in dict_of_dicts.items():
-            first_room_internal_name, second_room_internal_name = door_internal_name.split('_x_')
-            self._contents[first_room_internal_name][second_room_internal_name] = \
-                Door.subclassing_factory(internal_name=door_internal_name, **door_argd)
-            pass
+        # This comprehension recovers the two room internal names for each .ini
+        # entry and stores the Door subclass object under their sorted pair. The
+        # accessor methods below order the pair they're given with a single
+        # comparison to find the same key.
+        self._contents = {tuple(sorted(map(sys.intern, door_internal_name.split('_x_', 1)))):
+                              Door.subclassing_factory(internal_name=door_internal_name, **door_argd)
+                          for door_internal_name, door_argd in dict_of_dicts.items()}
 
     def contains(self, first_room_internal_name, second_room_internal_name):
         """
 This method tests whether a Door subclass object indexed by the given two Room
-subclass object's internal names is present in the internal **dict-of-dicts.
+subclass object's internal names is present in the internal dict.
 
 :first_room_internal_name: The internal name of one of the two linked Room
                            objects.
@@ -592,8 +772,9 @@ subclass object's internal names is present in the internal **dict-of-dicts.
                            objects.
 :return:                   A boolean.
         """
-        return (first_room_internal_name in self._contents
-                and second_room_internal_name in self._contents[first_room_internal_name])
+        if first_room_internal_name > second_room_internal_name:
+            first_room_internal_name, second_room_internal_name = second_room_internal_name, first_room_internal_name
+        return (first_room_internal_name, second_room_internal_name) in self._contents
 
     def get(self, first_room_internal_name, second_room_internal_name):
         """
@@ -606,14 +787,14 @@ subclass object internal names, or raises a KeyError if it's not present.
                            objects.
 :return:                   A Door object.
         """
-        return self._contents[first_room_internal_name][second_room_internal_name]
+        if first_room_internal_name > second_room_internal_name:
+            first_room_internal_name, second_room_internal_name = second_room_internal_name, first_room_internal_name
+        return self._contents[(first_room_internal_name, second_room_internal_name)]
 
     def set(self, first_room_internal_name, second_room_internal_name, door):
         """
-This method stores the given Door subclass object in the internal **dict-of-dicts
-using the first Room subclass object internal name as the key to the outer
-dictionary and the second Room subclass object internal name as the key to the
-inner dictionary.
+This method stores the given Door subclass object in the internal dict under the
+sorted pair of the two Room subclass object internal names.
 
 :first_room_internal_name: The internal name of one of the two linked Room
                            objects.
@@ -622,12 +803,14 @@ inner dictionary.
 :door:                     A Door object.
 :return:                   None.
         """
-        self._contents[first_room_internal_name][second_room_internal_name] = door
+        if first_room_internal_name > second_room_internal_name:
+            first_room_internal_name, second_room_internal_name = second_room_internal_name, first_room_internal_name
+        self._contents[(first_room_internal_name, second_room_internal_name)] = door
 
     def delete(self, first_room_internal_name, second_room_internal_name):
         """
-This method deletes the Door subclass object found in the internal **dict-of-dicts
-under the given two Room subclass object internal name keys.
+This method deletes the Door subclass object found in the internal dict under
+the sorted pair of the two given Room subclass object internal names.
 
 :first_room_internal_name: The internal name of one of the two linked Room
                            objects.
@@ -636,48 +819,43 @@ under the given two Room subclass object internal name keys.
 :door:                     A Door object.
 :return:                   None.
         """
-        del self._contents[first_room_internal_name][second_room_internal_name]
+        if first_room_internal_name > second_room_internal_name:
+            first_room_internal_name, second_room_internal_name = second_room_internal_name, first_room_internal_name
+        del self._contents[(first_room_internal_name, second_room_internal_name)]
+
+    # The three iteration methods below are all generators, so they iterate over
+    # the internal dict lazily without building a list.
 
     def keys(self):
         """
-This method returns a list of 2-tuples comprising each valid Room subclass
-internal name pairs that can be used as arguments to .get() to retrieve a Door
-subclass object.
+This method is a generator that yields 2-tuples comprising each valid Room
+subclass internal name pair that can be used as arguments to .get() to retrieve
+a Door subclass object.
 
-:return: A list of 2-tuples comprising pairs of Room internal name strings.
+:return: A generator of 2-tuples comprising pairs of Room internal name strings.
         """
-        keys_list = list()
-        for first_room_name in self._contents.keys():
-            for second_room_name in self._contents[first_room_name].keys():
-                keys_list.append((first_room_name, second_room_name))
-        return keys_list
+        yield from self._contents
 
     def values(self):
         """
-This method returns a list comprising all the Door subclass objects stored in
-the internal **dict-of-dicts.
+This method is a generator that yields all the Door subclass objects stored in
+the internal dict.
 
-:return: A list of Door objects.
+:return: A generator of Door objects.
         """
-        values_list = list()
-        for first_room_name in self._contents.keys():
-            values_list.extend(self._contents[first_room_name].values())
-        return values_list
+        yield from self._contents.values()
 
     def items(self):
         """
-This method returns a list of 3-tuples, each comprising a pair of Room subclass
-object internal names that are a key to the container, coupled with the Door
-subclass object that is the value to that key.
+This method is a generator that yields 3-tuples, each comprising a pair of Room
+subclass object internal names that are a key to the container, coupled with the
+Door subclass object that is the value to that key.
 
-:return: A list of 3-tuples, comprised of a string (the internal name), an int
-         (the quantity) and an Item subclass object.
+:return: A generator of 3-tuples, comprised of two strings (the Room internal
+         names) and a Door subclass object.
         """
-        items_list = list()
-        for first_room_name in self._contents.keys():
-            for second_room_name, door in self._contents[first_room_name].items():
-                items_list.append((first_room_name, second_room_name, door))
-        return items_list
+        for (first_room_name, second_room_name), door in self._contents.items():
+            yield first_room_name, second_room_name, door
 
     def size(self):
         """
@@ -686,7 +864,7 @@ container.
 
 :return: An int, the number of Item subclass objects stored.
         """
-        return len(self.keys())
+        return len(self._contents)
 
 
 class Container(Ini_Entry, Items_Multi_State):
@@ -699,11 +877,12 @@ items.ini, but also can contain Item subclass objects.
 
     def __init__(self, items_state, internal_name, *item_objs, **ini_constr_argd):
         r"""
-This __init__ method calls both parent class's __init__ methods in sequence.
-It draws on the contents attribute of the source ini data, which is in the
+This __init__ method calls Ini_Entry.__init__ and then fills the internal dicts
+that Items_Multi_State manages directly. It draws on the contents attribute of
+the source ini data, which is in the
 \[\d+x[A-Z][A-Za-z_]+(,\d+x[A-Z][A-Za-z_]+)*\] format, and unpacks it. An
-items_state object is a required argument so that it can be used to look up Item
-subclass objects' internal names and populate the container.
+items_state object is a required argument so that it can be used to look up
+Item subclass objects' internal names and populate the container.
 
 :items_state:        An Item_State object.
 :internal_name:     The internal name of the container.
@@ -712,27 +891,20 @@ subclass objects' internal names and populate the container.
                     Container object with.
         """
         contents_str = ini_constr_argd.pop('contents', None)
-        Ini_Entry.__init__(self, internal_name=internal_name, **ini_constr_argd)
+        # Items_Multi_State.__init__ would only set empty dicts here, so I set
+        # them myself and populate them in the same pass below.
+        self._contents = contents = dict()
+        self._qty = qty = dict()
+        Ini_Entry.__init__(self, internal_name=sys.intern(internal_name), **ini_constr_argd)
         # If this Container has a contents attribute, it is a compacted list of
         # Item internal names and quantities. _process_list_value unpacks it and
-        # returns quantity-internal_name pairs.
-        if contents_str:
-            contents_qtys_names = self._process_list_value(contents_str)
-            # This list comprehension retrieves the Item subclass objects from
-            # items_state.
-            contents_qtys_item_objs = tuple((item_qty, items_state.get(item_internal_name))
-                                             for item_qty, item_internal_name in contents_qtys_names)
-        Items_Multi_State.__init__(self)
+        # returns quantity-internal_name pairs; I retrieve each Item subclass
+        # object from items_state and store it with its quantity.
         if contents_str:
-            # If the contents attribute was non-None, contents_qtys_item_objs
-            # contains the quantities and Item subclass objects to populate this
-            # Container object with. I set each internal name to the quantity
-            # and Item subclass object values in turn.
-            for item_qty, item in contents_qtys_item_objs:
-                self.set(item.internal_name, item_qty, item)
-        # This cleanup step sets any attributes from __slots__ not yet to None
-        # explicitly.
-        self._post_init_slots_set_none(self.__slots__)
+            for item_qty, item_internal_name in self._process_list_value(contents_str):
+                item = items_state.get(item_internal_name)
+                contents[item.internal_name] = item
+                qty[item.internal_name] = item_qty
 
     @classmethod
     def subclassing_factory(self, items_state, **container_dict):
@@ -745,11 +917,10 @@ is appropriate to instantiate from the data.
 :**container_dict: A dict of key-value pairs to instantiate the Container
                    subclass with.
         """
-        if container_dict['container_type'] == 'chest':
-            container = Chest(items_state, **container_dict)
-        elif container_dict['container_type'] == 'corpse':
-            container = Corpse(items_state, **container_dict)
-        return container
+        container_class = _CONTAINER_CLASSES.get(container_dict['container_type'])
+        if container_class is None:
+            raise excpt.Internal_Exception(f'unrecognized container type: {container_dict["container_type"]}')
+        return container_class(items_state, **container_dict)
 
 
 class Chest(Container):
@@ -758,7 +929,7 @@ This Container subclass is used to represent containers which are chests. It
 offers no functionality, but is useful for detecting chest objects by type
 testing.
     """
-    pass
+    __slots__ = ()
 
 
 class Corpse(Container):
@@ -767,7 +938,13 @@ This Container subclass is used to represent containers which are corpses. It
 offers no functionality, but is useful for detecting corpse objects by type
 testing.
     """
-    pass
+    __slots__ = ()
+
+
+# This lookup table is used by Container.subclassing_factory to select the
+# Container subclass to instantiate from a containers.ini entry's container_type
+# value.
+_CONTAINER_CLASSES = {'chest': Chest, 'corpse': Corpse}
 
 
 class Containers_State(Items_State):
@@ -788,11 +965,25 @@ is populated with.
                   which are key-value pairs to initialize an individual
                   Container subclass object with.
         """
-        self._contents = dict()
-        for container_internal_name, container_dict in dict_of_dicts.items():
-            container = Container.subclassing_factory(items_state, internal_name=container_internal_name,
-                                                          **container_dict)
-            self._contents[container_internal_name] = container
+        container_factory = Container.subclassing_factory
+        self._contents = {container_internal_name: container_factory(items_state,
+                                                                     internal_name=container_internal_name,
+                                                                     **container_dict)
+                          for container_internal_name, container_dict in zip(map(sys.intern, dict_of_dicts.keys()),
+                                                                             dict_of_dicts.values())}
+
+
+# In modern D&D, the derived value from an ability score that is relevant to
+# determining outcomes is the 'stat mod' (or 'stat modifier'), which is computed
+# from the ability score by subtracting 10, dividing by 2 and rounding down. The
+# right shift floors toward negative infinity for python ints just as
+# math.floor() of the quotient would.
+#
+# Ability_Scores keeps its scores in a signed-byte array, so a score is always
+# in -128..127 and the modifier for every one of them is precomputed here. The
+# negative scores are stored at the end of the tuple so that a negative index
+# lands on its own entry, the same as a nonnegative one does.
+_MOD_LUT = tuple((ability_score - 10) >> 1 for ability_score in (*range(128), *range(-128, 0)))
 
 
 class Ability_Scores(object):
@@ -801,73 +992,145 @@ This class is one of the dependencies of the Character and Creature classes
 and is only used as a subordinate object to them. It abstracts the six ability
 scores of a Character or Creature and provides methods for using them.
     """
-    __slots__ = 'strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma', 'character_class'
-
-    weightings = {
-        'Warrior': ('strength', 'constitution', 'dexterity', 'intelligence', 'charisma', 'wisdom'),
-        'Thief': ('dexterity', 'constitution', 'charisma', 'strength', 'wisdom', 'intelligence'),
-        'Priest': ('wisdom', 'strength', 'constitution', 'charisma', 'intelligence', 'dexterity'),
-        'Mage': ('intelligence', 'dexterity', 'constitution', 'strength', 'wisdom', 'charisma')
-    }
+    # The six ability scores are stored in a compact signed-byte array, indexed
+    # in _ABILITY_NAMES order, behind properties so that each score's setter can
+    # recompute its modifier; the six *_mod slots hold those cached modifiers,
+    # so reading one is a plain attribute access.
+    __slots__ = ('_scores', 'strength_mod', 'dexterity_mod', 'constitution_mod', 'intelligence_mod', 'wisdom_mod',
+                 'charisma_mod', 'character_class', '_version')
 
     @property
-    def strength_mod(self):
+    def strength(self):
         """
-This property computes the Strength modifier from the stored Strength score.
+This property returns the stored Strength score.
 
 :return: An int.
         """
-        return self._stat_mod('strength')
+        return self._scores[_STR]
+
+    @strength.setter
+    def strength(self, value):
+        """
+This setter stores the Strength score and recomputes the cached strength_mod
+attribute from it. It also increments the version counter that Character uses to
+tell when its cached combat values are stale.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_STR] = value
+        self.strength_mod = _MOD_LUT[value]
+        self._version += 1
 
     @property
-    def dexterity_mod(self):
+    def dexterity(self):
         """
-This property computes the Dexterity modifier from the stored Dexterity score.
+This property returns the stored Dexterity score.
 
 :return: An int.
         """
-        return self._stat_mod('dexterity')
+        return self._scores[_DEX]
+
+    @dexterity.setter
+    def dexterity(self, value):
+        """
+This setter stores the Dexterity score and recomputes the cached dexterity_mod
+attribute from it.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_DEX] = value
+        self.dexterity_mod = _MOD_LUT[value]
+        self._version += 1
 
     @property
-    def constitution_mod(self):
+    def constitution(self):
         """
-This property computes the Constitution modifier from the stored Constitution score.
+This property returns the stored Constitution score.
 
 :return: An int.
         """
-        return self._stat_mod('constitution')
+        return self._scores[_CON]
+
+    @constitution.setter
+    def constitution(self, value):
+        """
+This setter stores the Constitution score and recomputes the cached constitution_mod
+attribute from it.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_CON] = value
+        self.constitution_mod = _MOD_LUT[value]
+        self._version += 1
 
     @property
-    def intelligence_mod(self):
+    def intelligence(self):
         """
-This property computes the Intelligence modifier from the stored Intelligence score.
+This property returns the stored Intelligence score.
 
 :return: An int.
         """
-        return self._stat_mod('intelligence')
+        return self._scores[_INT]
+
+    @intelligence.setter
+    def intelligence(self, value):
+        """
+This setter stores the Intelligence score and recomputes the cached intelligence_mod
+attribute from it.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_INT] = value
+        self.intelligence_mod = _MOD_LUT[value]
+        self._version += 1
 
     @property
-    def wisdom_mod(self):
+    def wisdom(self):
         """
-This property computes the Wisdom modifier from the stored Wisdom score.
+This property returns the stored Wisdom score.
 
 :return: An int.
         """
-        return self._stat_mod('wisdom')
+        return self._scores[_WIS]
+
+    @wisdom.setter
+    def wisdom(self, value):
+        """
+This setter stores the Wisdom score and recomputes the cached wisdom_mod
+attribute from it.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_WIS] = value
+        self.wisdom_mod = _MOD_LUT[value]
+        self._version += 1
 
     @property
-    def charisma_mod(self):
+    def charisma(self):
         """
-This property computes the Charisma modifier from the stored Charisma score.
+This property returns the stored Charisma score.
 
 :return: An int.
         """
-        return self._stat_mod('charisma')
+        return self._scores[_CHA]
 
-    # In modern D&D, the derived value from an ability score that is relevant
-    # to determining outcomes is the 'stat mod' (or 'stat modifier'), which
-    # is computed from the ability score by subtracting 10, dividing by 2 and
-    # rounding down. That is implemented here.
+    @charisma.setter
+    def charisma(self, value):
+        """
+This setter stores the Charisma score and recomputes the cached charisma_mod
+attribute from it.
+
+:value:  An int.
+:return: None.
+        """
+        self._scores[_CHA] = value
+        self.charisma_mod = _MOD_LUT[value]
+        self._version += 1
 
     def _stat_mod(self, ability_score):
         """
@@ -878,9 +1141,9 @@ arbitrary ability score.
                 'Intelligence', 'Wisdom' or 'Charisma'.
 :return:        An int.
         """
-        if not hasattr(self, ability_score):
+        if ability_score not in _ABILITY_NAMES:
             raise excpt.Internal_Exception(f'unrecognized ability {ability_score}')
-        return math.floor((getattr(self, ability_score) - 10) / 2)
+        return getattr(self, ability_score + '_mod')
 
     def __init__(self, character_class_str):
         """
@@ -891,10 +1154,17 @@ different ability priority ordering.
 
 :character_class_str: One of 'Warrior', 'Thief', 'Priest' or 'Mage'.
         """
-        if character_class_str not in self.weightings:
+        if character_class_str not in _WEIGHTINGS:
             raise excpt.Internal_Exception(f'character class {character_class_str} not recognized, should be one of '
                                       "'Warrior', 'Thief', 'Priest' or 'Mage'")
         self.character_class = character_class_str
+        # The scores start out at zero until they're set or rolled, and the
+        # cached modifiers are set from them the same way roll_stats() does, so
+        # the scores and modifiers always agree.
+        self._scores = scores = array.array('b', bytes(6))
+        (self.strength_mod, self.dexterity_mod, self.constitution_mod, self.intelligence_mod, self.wisdom_mod,
+         self.charisma_mod) = map(_MOD_LUT.__getitem__, scores)
+        self._version = 0
 
     # Rolling a six-sided die 4 times and then dropping the lowest roll before
     # summing the remaining 3 results to reach a value for an ability score (or
@@ -910,15 +1180,26 @@ three are summed to yield an ability score value.
 
 :return: None.
         """
-        results_list = list()
-        for _ in range(0, 6):
-            four_rolls = sorted([random.randint(1, 6) for _ in range(0, 4)])
-            three_rolls = four_rolls[1:4]
-            results_list.append(sum(three_rolls))
-        results_list.sort()
-        results_list.reverse()
-        for index in range(0, 6):
-            setattr(self, self.weightings[self.character_class][index], results_list[index])
+        # I draw random bits 32 bytes at a time and turn each byte below 252
+        # into a die roll with byte % 6 + 1; 252 is a multiple of 6, so
+        # rejecting the 4 higher byte values keeps every face equally likely. At
+        # least 24 of the 32 bytes are nearly always usable, so this rarely
+        # loops. The rolls are then taken four at a time; dropping the lowest of
+        # four rolls is the same as subtracting the min from their sum.
+        rolls = []
+        while len(rolls) < 24:
+            rolls.extend(byte % 6 + 1 for byte in random.getrandbits(256).to_bytes(32, 'little') if byte < 252)
+        results_list = sorted((sum(four_rolls) - min(four_rolls)
+                               for four_rolls in (rolls[index:index + 4] for index in range(0, 24, 4))),
+                              reverse=True)
+        # The class's precomputed permutation picks, for each ability score in
+        # array order, which of the descending results it receives. The scores
+        # array is built in one step and all six modifiers are assigned at once.
+        self._scores = scores = array.array('b', [results_list[rank]
+                                                  for rank in _WEIGHTING_RANKS[self.character_class]])
+        (self.strength_mod, self.dexterity_mod, self.constitution_mod, self.intelligence_mod, self.wisdom_mod,
+         self.charisma_mod) = map(_MOD_LUT.__getitem__, scores)
+        self._version += 1
 
 
 class Equipment(object):
@@ -927,43 +1208,11 @@ This object represents the equipment held by a Character or Creature. It stores
 what items are equipped as the armor, shield, weapon or wand, and computes the
 derived values armor class, attack bonus and damage.
     """
-    __slots__ = 'character_class', 'armor', 'shield', 'weapon', 'wand'
-
-    @property
-    def armor_equipped(self):
-        """
-This property returns the armor that is equipped, or None if none is equipped.
-
-:return: An Armor object, or None.
-        """
-        return getattr(self, 'armor', None)
-
-    @property
-    def shield_equipped(self):
-        """
-This property returns the shield that is equipped, or None if none is equipped.
-
-:return: A Shield object, or None.
-        """
-        return getattr(self, 'shield', None)
-
-    @property
-    def weapon_equipped(self):
-        """
-This property returns the weapon that is equipped, or None if none is equipped.
-
-:return: A Weapon object, or None.
-        """
-        return getattr(self, 'weapon', None)
-
-    @property
-    def wand_equipped(self):
-        """
-This property returns the wand that is equipped, or None if none is equipped.
-
-:return: A Wand object, or None.
-        """
-        return getattr(self, 'wand', None)
+    # The armor, shield, weapon and wand slots are always set in __init__ and
+    # hold None when nothing is equipped there, so they're read directly. The
+    # _version counter is incremented on every equip or unequip so that
+    # Character can tell when its cached combat values are stale.
+    __slots__ = 'character_class', 'armor', 'shield', 'weapon', 'wand', '_version'
 
     def __init__(self, character_class, armor_item=None, shield_item=None, weapon_item=None, wand_item=None):
         """
@@ -975,6 +1224,10 @@ This __init__ method instantiates the object with the given character class, and
         self.shield = shield_item
         self.wand = wand_item
         self.weapon = weapon_item
+        self._version = 0
+
+    # The type checks in the equip_* methods guard against internal misuse only,
+    # so they're conditioned on __debug__ and compiled away under python -O.
 
     def equip_armor(self, item):
         """
@@ -983,8 +1236,10 @@ This method equips the given Armor object.
 :item:    An Armor object.
 :returns: None.
         """
-        if not isinstance(item, Armor):
-            raise excpt.Internal_Exception('the method `equip_armor()` only accepts `armor` objects for its argument')
+        if __debug__:
+            if not isinstance(item, Armor):
+                raise excpt.Internal_Exception('the method `equip_armor()` only accepts `armor` objects for its '
+                                               'argument')
         self._equip('armor', item)
 
     def equip_shield(self, item):
@@ -994,8 +1249,10 @@ This method equips the given Shield object.
 :item:    A Shield object.
 :returns: None.
         """
-        if not isinstance(item, Shield):
-            raise excpt.Internal_Exception('the method `equip_shield()` only accepts `shield` objects for its argument')
+        if __debug__:
+            if not isinstance(item, Shield):
+                raise excpt.Internal_Exception('the method `equip_shield()` only accepts `shield` objects for its '
+                                               'argument')
         self._equip('shield', item)
 
     def equip_weapon(self, item):
@@ -1005,8 +1262,10 @@ This method equips the given Weapon object.
 :item:    A Weapon object.
 :returns: None.
         """
-        if not isinstance(item, Weapon):
-            raise excpt.Internal_Exception('the method `equip_weapon()` only accepts `weapon` objects for its argument')
+        if __debug__:
+            if not isinstance(item, Weapon):
+                raise excpt.Internal_Exception('the method `equip_weapon()` only accepts `weapon` objects for its '
+                                               'argument')
         self._equip('weapon', item)
 
     def equip_wand(self, item):
@@ -1016,8 +1275,10 @@ This method equips the given Wand object.
 :item:    A Wand object.
 :returns: None.
         """
-        if not isinstance(item, Wand):
-            raise excpt.Internal_Exception('the method `equip_wand()` only accepts `wand` objects for its argument')
+        if __debug__:
+            if not isinstance(item, Wand):
+                raise excpt.Internal_Exception('the method `equip_wand()` only accepts `wand` objects for its '
+                                               'argument')
         self._equip('wand', item)
 
     def unequip_armor(self):
@@ -1060,16 +1321,10 @@ given slot.
 :equipment_slot: A string, one of 'armor', 'shield', 'weapon', or 'wand'.
 :return:         None.
         """
-        if equipment_slot not in ('armor', 'shield', 'weapon', 'wand'):
+        if equipment_slot not in _EQUIP_SLOTS:
             raise excpt.Internal_Exception(f'equipment slot {equipment_slot} not recognized')
-        if equipment_slot == 'armor':
-            self.armor = item
-        elif equipment_slot == 'shield':
-            self.shield = item
-        elif equipment_slot == 'weapon':
-            self.weapon = item
-        elif equipment_slot == 'wand':
-            self.wand = item
+        setattr(self, equipment_slot, item)
+        self._version += 1
 
     def _unequip(self, equipment_slot):
         """
@@ -1078,16 +1333,10 @@ This private method unequips the given Equippable_Item subclass object.
 :equipment_slot: A string, one of 'armor', 'shield', 'weapon', or 'wand'.
 :return:         None.
         """
-        if equipment_slot not in ('armor', 'shield', 'weapon', 'wand'):
+        if equipment_slot not in _EQUIP_SLOTS:
             raise excpt.Internal_Exception(f'equipment slot {equipment_slot} not recognized')
-        if equipment_slot == 'armor':
-            self.armor = None
-        elif equipment_slot == 'shield':
-            self.shield = None
-        elif equipment_slot == 'weapon':
-            self.weapon = None
-        elif equipment_slot == 'wand':
-            self.wand = None
+        setattr(self, equipment_slot, None)
+        self._version += 1
 
     @property
     def armor_class(self):
@@ -1098,9 +1347,9 @@ armor bonuses if any.
 :return: An int.
         """
         ac = 10
-        if self.armor_equipped:
+        if self.armor is not None:
             ac += self.armor.armor_bonus
-        if self.shield_equipped:
+        if self.shield is not None:
             ac += self.shield.armor_bonus
         return ac
 
@@ -1111,9 +1360,9 @@ This method returns the attack bonus associated with any equipped weapon or wand
 
 :return: An int.
         """
-        if self.wand_equipped:
+        if self.wand is not None:
             return self.wand.attack_bonus
-        elif self.weapon_equipped:
+        elif self.weapon is not None:
             return self.weapon.attack_bonus
         else:
             return None
@@ -1125,14 +1374,20 @@ This method returns the damage associated with any equipped weapon or wand.
 
 :return: A string of the form '\d+d\d+([+-]\d+)?'.
         """
-        if self.wand_equipped:
+        if self.wand is not None:
             return self.wand.damage
-        if self.weapon_equipped:
+        if self.weapon is not None:
             return self.weapon.damage
         else:
             return None
 
 
+# This table maps an equipment slot to the Equipment method that equips an item
+# in it, for Character._equip_generic.
+_EQUIPMENT_EQUIP_METHODS = {'armor': Equipment.equip_armor, 'shield': Equipment.equip_shield,
+                            'weapon': Equipment.equip_weapon, 'wand': Equipment.equip_wand}
+
+
 class Character(object):
     """
 This class represents a character. The player's interaction with the game rules
@@ -1142,24 +1397,7 @@ inventory.
     """
     __slots__ = ('character_name', 'character_class', 'magic_key_stat', '_hit_point_maximum', '_current_hit_points',
                  '_mana_point_maximum', '_current_mana_points', 'ability_scores', 'inventory',
-                 '_equipment')
-
-    # The rules for "mana" points I use in this class are drawn from Dungeons &
-    # Dragons 3rd edition rules. In those rules they're called "spell points".
-    # These two dicts are drawn from the variant Spell Points rules, which are
-    # available online at <http://dndsrd.net/unearthedSpellPoints.html>
-    _base_mana_points = {'Priest': 16, 'Mage': 19}
-
-    _bonus_mana_points = {-4: 0, -3: 0, -2: 0, -1: 0, 0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
-    # End data from that page.
-
-    # These defaults are adapted from D&D 3rd edition rules. This info is
-    # generic and doesn't have a citation.
-    _magic_key_stats = {'Priest': 'wisdom', 'Mage': 'intelligence'}
-    # End rules drawn from D&D.
-
-    # These are arbitrary.
-    _hitpoint_base = {'Warrior': 40, 'Priest': 30, 'Thief': 30, 'Mage': 20}
+                 '_equipment', '_attack_roll_cache', '_damage_roll_cache', '_armor_class_cache', '_combat_cache_version')
 
     def __init__(self, character_name_str, character_class_str, base_hit_points=0, base_mana_points=0,
                  magic_key_stat=None, strength=0, dexterity=0, constitution=0, intelligence=0, wisdom=0, charisma=0):
@@ -1201,6 +1439,11 @@ It also sets the magic key stat if any.
         self._set_up_ability_scores(strength, dexterity, constitution, intelligence, wisdom, charisma)
         self.inventory = Items_Multi_State()
         self._equipment = Equipment(character_class_str)
+        # The attack and damage roll strings and the armor class are cached
+        # along with the Equipment and Ability_Scores versions they were
+        # computed from; None never matches, so the first access computes them.
+        self._attack_roll_cache = self._damage_roll_cache = self._armor_class_cache = None
+        self._combat_cache_version = None
         # This step is refactored into a private method for readability. Its
         # logic is fairly complex, q.v.
         self._set_up_hit_points_and_mana_points(base_hit_points, base_mana_points, magic_key_stat)
@@ -1224,14 +1467,14 @@ furnished.
 :charisma:     An int, the set value for the character's Charisma score
                (optional).
         """
-        if all((strength, dexterity, constitution, intelligence, wisdom, charisma)):
+        if strength and dexterity and constitution and intelligence and wisdom and charisma:
             self.ability_scores.strength = strength
             self.ability_scores.dexterity = dexterity
             self.ability_scores.constitution = constitution
             self.ability_scores.intelligence = intelligence
             self.ability_scores.wisdom = wisdom
             self.ability_scores.charisma = charisma
-        elif any((strength, dexterity, constitution, intelligence, wisdom, charisma)):
+        elif strength or dexterity or constitution or intelligence or wisdom or charisma:
             raise excpt.Internal_Exception('The constructor for `character` must be supplied with either all of the arguments'
                                      ' `strength`, `dexterity`, `constitution`, `intelligence`, `wisdom`, and '
                                      '`charisma` or none of them.')
@@ -1255,77 +1498,67 @@ Priests).
         # When the Character is instanced by a Game_State object, none of
         # these values are supplied to __init__. But the Creature object that
         # subclasses Character draws its values from an .ini entry and it does
-        # have all these values supplied to __init__.
+        # have all these values supplied to __init__. Each value is taken from
+        # its argument if supplied, and otherwise read from the module-level
+        # class default tables.
         #
-        # Base hit points are taken either from an argument to __init__ or from
-        # the class's default in the _hitpoint_base dict.
-        if base_hit_points:
-            self._hit_point_maximum = self._current_hit_points = (base_hit_points +
-                                                                  self.ability_scores.constitution_mod * 3)
-        else:
-            self._hit_point_maximum = self._current_hit_points = (self._hitpoint_base[self.character_class]
-                                                                  + self.ability_scores.constitution_mod * 3)
-        # Magic key stat can be set from the arguments to __init__ or drawn from class defaults.
-        if magic_key_stat:
-            if magic_key_stat not in ('intelligence', 'wisdom', 'charisma'):
-                raise excpt.Internal_Exception("`magic_key_stat` argument '" + magic_key_stat + "' not recognized")
-            self.magic_key_stat = magic_key_stat
-        else:
-            if self.character_class == 'Priest':
-                self.magic_key_stat = 'wisdom'
-            elif self.character_class == 'Mage':
-                self.magic_key_stat = 'intelligence'
-            else:
-                self.magic_key_stat = ''
-                self._mana_point_maximum = self._current_mana_points = 0
-                return
-        magic_key_stat_mod = getattr(self, self.magic_key_stat + '_mod', None)
-        # These assignments add bonus mana points from the _bonus_mana_points
-        # dict. A spellcaster with a high spellcasting stat (16-18) can gain a
-        # lot of extra mana points.
-        if base_mana_points:
-            self._mana_point_maximum = self._current_mana_points = (base_mana_points
-                                                                    + self._bonus_mana_points[magic_key_stat_mod])
-        elif self.character_class in self._base_mana_points:
-            self._mana_point_maximum = self._current_mana_points = (self._base_mana_points[self.character_class]
-                                                                    + self._bonus_mana_points[magic_key_stat_mod])
-        else:
+        # Base hit points come either from __init__ or from _HITPOINT_BASE.
+        self._hit_point_maximum = self._current_hit_points = (
+            (base_hit_points or _HITPOINT_BASE[self.character_class]) + self.ability_scores.constitution_mod * 3)
+        # Magic key stat can be set from the arguments to __init__ or drawn from
+        # class defaults; non-spellcasting classes have none.
+        if magic_key_stat and magic_key_stat not in ('intelligence', 'wisdom', 'charisma'):
+            raise excpt.Internal_Exception("`magic_key_stat` argument '" + magic_key_stat + "' not recognized")
+        self.magic_key_stat = magic_key_stat or _MAGIC_KEY_STATS.get(self.character_class, '')
+        base_mana_points = base_mana_points or _BASE_MANA_POINTS.get(self.character_class, 0)
+        if not (self.magic_key_stat and base_mana_points):
             self._mana_point_maximum = self._current_mana_points = 0
-
-    def _attack_or_damage_stat_dependency(self):
-        """
-This private method is used by attack_roll(), attack_bonus() and damage()
-to determine which ability score modifier to add to attack and damage. It's
-Strength for Warriors, Priests, and Mages wielding a weapon; it's Dexterity for
-Thieves, and it's Intelligence for Mages wielding a wand.
-
-:return: A string, one of 'strength', 'dexterity', or 'intelligence'.
+            return
+        # Bonus mana points come from the _BONUS_MANA_POINTS table. A
+        # spellcaster with a high spellcasting stat (16-18) can gain a lot of
+        # extra mana points. The modifier is clamped to the table's -4 to 4 range
+        # before it's offset into an index.
+        magic_key_stat_mod = getattr(self.ability_scores, self.magic_key_stat + '_mod')
+        self._mana_point_maximum = self._current_mana_points = (
+            base_mana_points + _BONUS_MANA_POINTS[min(max(magic_key_stat_mod, -4), 4) + 4])
+
+    def _attack_stat_mod(self, weapon):
+        """
+This private method returns the ability score modifier that is added to attack
+and damage: Strength for Warriors, Priests, and Mages wielding a weapon;
+Dexterity for Thieves; and Intelligence for Mages wielding a wand. It's the one
+place that rule is written down; _attack_context and attack_bonus both use it.
+
+:weapon: The equipped Weapon object, or None.
+:return: An int.
         """
         # The convention that a Mage using a spell add Intelligence to their
         # attack & damage is drawn from Dungeons & Dragons 5th edition rules as
         # laid out in the 5th edition _Player's Handbook_.
-        if self.character_class in ('Warrior', 'Priest') or (self.character_class == 'Mage'
-                                                             and self._equipment.weapon_equipped):
-            return 'strength'
-        elif self.character_class == 'Thief':
-            return 'dexterity'
-        else:  # By exclusion, (`character_class` == 'Mage' and self._equipment.wand_equipped)
-            return 'intelligence'
+        character_class = self.character_class
+        if character_class == 'Thief':
+            return self.ability_scores.dexterity_mod
+        elif character_class == 'Mage' and weapon is None:
+            return self.ability_scores.intelligence_mod
+        else:
+            return self.ability_scores.strength_mod
 
     @property
-    def _item_attacking_with(self):
+    def _attack_context(self):
         """
-This private property returns the wand object equipped if there is one,
-otherwise the weapon object equipped if there is one, otherwise None.
+This private property gathers what both the attack roll and the damage roll
+need in a single pass: the item attacked with (the wand if one is equipped,
+otherwise the weapon) and the ability score modifier from _attack_stat_mod(). If
+neither a weapon nor a wand is equipped, it returns None.
 
-:return: A Wand object, a Weapon object, or None.
+:return: A 2-tuple of a Wand or Weapon object and an int, or None.
         """
-        if self._equipment.wand_equipped:
-            return self._equipment.wand
-        elif self._equipment.weapon_equipped:
-            return self._equipment.weapon
-        else:
+        equipment = self._equipment
+        wand = equipment.wand
+        weapon = equipment.weapon
+        if wand is None and weapon is None:
             return None
+        return (wand if wand is not None else weapon), self._attack_stat_mod(weapon)
 
     @property
     def hit_point_total(self):
@@ -1372,13 +1605,10 @@ returns the amount of damage assessed.
 :damage_value: An int, the number of hit points to lose.
 :return:       An int.
         """
-        if self._current_hit_points - damage_value < 0:
-            taken_amount = self._current_hit_points
-            self._current_hit_points = 0
-            return taken_amount
-        else:
-            self._current_hit_points -= damage_value
-            return damage_value
+        new_hit_points = max(0, self._current_hit_points - damage_value)
+        taken_amount = self._current_hit_points - new_hit_points
+        self._current_hit_points = new_hit_points
+        return taken_amount
 
     def heal_damage(self, healing_value):
         """
@@ -1390,13 +1620,10 @@ method returns the amount of healing done.
 :healing_value: An int, the number of hit points to recover.
 :return:        An int.
         """
-        if self._current_hit_points + healing_value > self._hit_point_maximum:
-            amount_healed = self._hit_point_maximum - self._current_hit_points
-            self._current_hit_points = self._hit_point_maximum
-            return amount_healed
-        else:
-            self._current_hit_points += healing_value
-            return healing_value
+        new_hit_points = min(self._hit_point_maximum, self._current_hit_points + healing_value)
+        amount_healed = new_hit_points - self._current_hit_points
+        self._current_hit_points = new_hit_points
+        return amount_healed
 
     def spend_mana(self, spent_amount):
         """
@@ -1410,9 +1637,8 @@ and 0 is returned to indicate failure.
         """
         if self._current_mana_points < spent_amount:
             return 0
-        else:
-            self._current_mana_points -= spent_amount
-            return spent_amount
+        self._current_mana_points -= spent_amount
+        return spent_amount
 
     def regain_mana(self, regaining_value):
         """
@@ -1424,13 +1650,10 @@ value instead. The method returns the amount of mana points regained.
 :regaining_value: An int, the number of mana points to regain.
 :return:          An int.
         """
-        if self._current_mana_points + regaining_value > self._mana_point_maximum:
-            amount_regained = self._mana_point_maximum - self._current_mana_points
-            self._current_mana_points = self._mana_point_maximum
-            return amount_regained
-        else:
-            self._current_mana_points += regaining_value
-            return regaining_value
+        new_mana_points = min(self._mana_point_maximum, self._current_mana_points + regaining_value)
+        amount_regained = new_mana_points - self._current_mana_points
+        self._current_mana_points = new_mana_points
+        return amount_regained
 
     @property
     def is_alive(self):
@@ -1455,25 +1678,62 @@ This property returns True if the character's hit point total equals 0.
         r"""
 This property returns a dice expression usable by
 adventuregame.utilities.roll_dice() to execute an attack roll during an ATTACK
-command. It calculates the attack bonus from the equipped item and the relevant
-ability score modifier.
+command. The value is cached and only recomputed after equipment or ability
+scores change.
+
+:return: A string of the form '\d+d\d+([+-]\d+)?'.
+        """
+        self._refresh_combat_caches()
+        return self._attack_roll_cache
+
+    @property
+    def damage_roll(self):
+        r"""
+This property returns a dice expression usable by
+adventuregame.utilities.roll_dice() to execute a damage roll during an ATTACK
+command. The value is cached and only recomputed after equipment or ability
+scores change.
 
 :return: A string of the form '\d+d\d+([+-]\d+)?'.
+        """
+        self._refresh_combat_caches()
+        return self._damage_roll_cache
+
+    def _refresh_combat_caches(self):
+        """
+This private method recomputes the cached attack and damage roll strings and
+armor class if the subordinate Equipment or Ability_Scores object has changed
+since they were last computed.
+
+:return: None.
+        """
+        combat_cache_version = (self._equipment._version, self.ability_scores._version)
+        if self._combat_cache_version != combat_cache_version:
+            self._armor_class_cache = self._equipment.armor_class + self.dexterity_mod
+            # If no weapon or wand is equipped, both rolls are None.
+            attack_context = self._attack_context
+            if attack_context is None:
+                self._attack_roll_cache = self._damage_roll_cache = None
+            else:
+                self._attack_roll_cache = self._compute_attack_roll(*attack_context)
+                self._damage_roll_cache = self._compute_damage_roll(*attack_context)
+            self._combat_cache_version = combat_cache_version
+
+    def _compute_attack_roll(self, item_attacking_with, stat_mod):
+        r"""
+This private method computes the attack roll dice expression. It calculates the
+attack bonus from the equipped item and the relevant ability score modifier.
+
+:item_attacking_with: The equipped Wand or Weapon object.
+:stat_mod:            An int, the applicable ability score modifier.
+:return:              A string of the form '\d+d\d+([+-]\d+)?'.
         """
         # This standard for formulating attack rolls is drawn from Dungeons &
         # Dragon 3rd edition. Those rules can be found at <https://dndsrd.net/>.
         #
-        # If no weapon or wand is equipped, None is returned.
-        if not (self._equipment.weapon_equipped or self._equipment.wand_equipped):
-            return None
         # The ability score can be strength, dexterity or intelligence,
-        # depending on class. Its modifier is added to the attack roll.
-        stat_dependency = self._attack_or_damage_stat_dependency()
-
-        # The item attacking with can have a bonus to attack. That is added to
-        # the attack roll.
-        item_attacking_with = self._item_attacking_with
-        stat_mod = getattr(self.ability_scores, stat_dependency+'_mod')
+        # depending on class. Its modifier is added to the attack roll, as is
+        # the attack bonus of the item attacking with.
         total_mod = item_attacking_with.attack_bonus + stat_mod
         mod_str = '+' + str(total_mod) if total_mod > 0 else str(total_mod) if total_mod < 0 else ''
 
@@ -1482,36 +1742,26 @@ ability score modifier.
         # number generation and execute it.
         return '1d20' + mod_str
 
-    @property
-    def damage_roll(self):
+    def _compute_damage_roll(self, item_attacking_with, stat_mod):
         r"""
-This property returns a dice expression usable by
-adventuregame.utilities.roll_dice() to execute a damage roll during an ATTACK
-command. It calculates the damage dice value from the equipped wand or weapon,
-and the relevant ability score modifier.
+This private method computes the damage roll dice expression. It calculates the
+damage dice value from the equipped wand or weapon, and the relevant ability
+score modifier.
 
-:return: A string of the form '\d+d\d+([+-]\d+)?'.
+:item_attacking_with: The equipped Wand or Weapon object.
+:stat_mod:            An int, the applicable ability score modifier.
+:return:              A string of the form '\d+d\d+([+-]\d+)?'.
         """
         # This standard for formulating damage rolls is drawn from Dungeons &
         # Dragon 3rd edition. Those rules can be found at <https://dndsrd.net/>.
-        if not (self._equipment.weapon_equipped or self._equipment.wand_equipped):
-            return None
-        stat_dependency = self._attack_or_damage_stat_dependency()
-        item_attacking_with = self._item_attacking_with
-        item_damage = item_attacking_with.damage
-
-        # The item's damage is a die roll and an optional modifier. This step
-        # splits that into the dice and the modifier.
-        damage_base_dice, damage_mod = (item_damage.split('+') if '+' in item_damage
-                                        else item_damage.split('-') if '-' in item_damage
-                                        else (item_damage, '0'))
-        damage_mod = int(damage_mod)
-
-        # The damage modifier needs to be adjusted by the stat mod from above.
-        total_damage_mod = damage_mod + getattr(self.ability_scores, stat_dependency+'_mod')
-        damage_str = damage_base_dice + ('+' + str(total_damage_mod) if total_damage_mod > 0
-                                         else str(total_damage_mod) if total_damage_mod < 0
-                                         else '')
+        #
+        # The item's damage is a die roll and an optional modifier, which were
+        # split apart when the item was loaded. The damage modifier needs to be
+        # adjusted by the stat mod.
+        total_damage_mod = item_attacking_with._damage_mod + stat_mod
+        damage_str = (f'{item_attacking_with._damage_dice}+{total_damage_mod}' if total_damage_mod > 0
+                      else f'{item_attacking_with._damage_dice}{total_damage_mod}' if total_damage_mod < 0
+                      else item_attacking_with._damage_dice)
         # The dice expression is reassembled with the changed modifier, and
         # returned.
         return damage_str
@@ -1536,10 +1786,10 @@ the quantity specified, default 1.
 :qty:    An int, the quantity to add to the container, default 1.
 :return: None.
         """
-        have_qty = self.item_have_qty(item)
         if qty == 1:
             self.inventory.add_one(item.internal_name, item)
         else:
+            have_qty = self.inventory.qty_of(item.internal_name)
             self.inventory.set(item.internal_name, qty + have_qty, item)
 
     def drop_item(self, item, qty=1):
@@ -1551,7 +1801,7 @@ subclass object from the character's inventory.
 :qty:    An int, the quantity to remove from the container, default 1.
 :return: None.
         """
-        have_qty = self.item_have_qty(item)
+        have_qty = self.inventory.qty_of(item.internal_name)
         if have_qty == 0:
             raise KeyError(item.internal_name)
         if have_qty == qty:
@@ -1568,11 +1818,7 @@ returns 0.
 :item:   An Item subclass object.
 :return: An int.
         """
-        if not self.inventory.contains(item.internal_name):
-            return 0
-        else:
-            have_qty, _ = self.inventory.get(item.internal_name)
-            return have_qty
+        return self.inventory.qty_of(item.internal_name)
 
     def have_item(self, item):
         """
@@ -1582,7 +1828,7 @@ character's inventory. It returns True or False.
 :item:   An Item subclass object.
 :return: A boolean.
         """
-        return self.inventory.contains(item.internal_name)
+        return self.inventory.qty_of(item.internal_name) != 0
 
     def list_items(self):
         """
@@ -1592,7 +1838,7 @@ Item subclass object's title attributes.
 
 :return: A list of 2-tuples.
         """
-        return list(sorted(self.inventory.values(), key=lambda *argl: argl[0][1].title))
+        return sorted(self.inventory.values(), key=lambda qty_and_item: qty_and_item[1].title)
 
     # BEGIN passthrough methods for private Ability_Scores
     @property
@@ -1603,7 +1849,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'strength')
+        return self.ability_scores.strength
 
     @property
     def dexterity(self):
@@ -1613,7 +1859,7 @@ subordinate Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'dexterity')
+        return self.ability_scores.dexterity
 
     @property
     def constitution(self):
@@ -1623,7 +1869,7 @@ subordinate Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'constitution')
+        return self.ability_scores.constitution
 
     @property
     def intelligence(self):
@@ -1633,7 +1879,7 @@ subordinate Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'intelligence')
+        return self.ability_scores.intelligence
 
     @property
     def wisdom(self):
@@ -1643,7 +1889,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'wisdom')
+        return self.ability_scores.wisdom
 
     @property
     def charisma(self):
@@ -1653,7 +1899,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return getattr(self.ability_scores, 'charisma')
+        return self.ability_scores.charisma
 
     @property
     def strength_mod(self):
@@ -1663,7 +1909,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('strength')
+        return self.ability_scores.strength_mod
 
     @property
     def dexterity_mod(self):
@@ -1673,7 +1919,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('dexterity')
+        return self.ability_scores.dexterity_mod
 
     @property
     def constitution_mod(self):
@@ -1683,7 +1929,7 @@ subordinate Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('constitution')
+        return self.ability_scores.constitution_mod
 
     @property
     def intelligence_mod(self):
@@ -1693,7 +1939,7 @@ subordinate Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('intelligence')
+        return self.ability_scores.intelligence_mod
 
     @property
     def wisdom_mod(self):
@@ -1703,7 +1949,7 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('wisdom')
+        return self.ability_scores.wisdom_mod
 
     @property
     def charisma_mod(self):
@@ -1713,49 +1959,49 @@ Ability_Scores object.
 
 :return: An int.
         """
-        return self.ability_scores._stat_mod('charisma')
+        return self.ability_scores.charisma_mod
     # END passthrough methods for private Ability_Scores
 
     # BEGIN passthrough methods for private _equipment
     @property
     def armor_equipped(self):
         """
-This property returns the armor_equipped property from the subordinate Equipment
+This property returns the armor attribute of the subordinate Equipment
 object.
 
 :return: An Armor object, or None.
         """
-        return self._equipment.armor_equipped
+        return self._equipment.armor
 
     @property
     def shield_equipped(self):
         """
-This property returns the shield_equipped property from the subordinate
-Equipment object.
+This property returns the shield attribute of the subordinate Equipment
+object.
 
 :return: A Shield object, or None.
         """
-        return self._equipment.shield_equipped
+        return self._equipment.shield
 
     @property
     def weapon_equipped(self):
         """
-This property returns the weapon_equipped property from the subordinate
-Equipment object.
+This property returns the weapon attribute of the subordinate Equipment
+object.
 
 :return: A Weapon object, or None.
         """
-        return self._equipment.weapon_equipped
+        return self._equipment.weapon
 
     @property
     def wand_equipped(self):
         """
-This property returns the wand_equipped property from the subordinate Equipment
+This property returns the wand attribute of the subordinate Equipment
 object.
 
 :return: A Wand object, or None.
         """
-        return self._equipment.wand_equipped
+        return self._equipment.wand
 
     @property
     def armor(self):
@@ -1796,54 +2042,56 @@ This property returns the wand property from the subordinate Equipment object.
     def equip_armor(self, item):
         """
 This method calls the equip_armor method on the subordinate Equipment object
-with the given argument.
+with the given argument, if it's in the character's inventory.
 
 :item:   An Armor object.
 :return: None.
         """
-        if not self.inventory.contains(item.internal_name):
-            raise excpt.Internal_Exception("equipping an `item` object that is not in the character's `inventory` object is "
-                                     'not allowed')
-        return self._equipment.equip_armor(item)
+        self._equip_generic('armor', item)
 
     def equip_shield(self, item):
         """
 This method calls the equip_shield method on the subordinate Equipment object
-with the given argument.
+with the given argument, if it's in the character's inventory.
 
 :item:   A Shield object.
 :return: None.
         """
-        if not self.inventory.contains(item.internal_name):
-            raise excpt.Internal_Exception("equipping an `item` object that is not in the character's `inventory` object is "
-                                     'not allowed')
-        return self._equipment.equip_shield(item)
+        self._equip_generic('shield', item)
 
     def equip_weapon(self, item):
         """
 This method calls the equip_weapon method on the subordinate Equipment object
-with the given argument.
+with the given argument, if it's in the character's inventory.
 
 :item:   A Weapon object.
 :return: None.
         """
-        if not self.inventory.contains(item.internal_name):
-            raise excpt.Internal_Exception("equipping an `item` object that is not in the character's `inventory` object is "
-                                     'not allowed')
-        return self._equipment.equip_weapon(item)
+        self._equip_generic('weapon', item)
 
     def equip_wand(self, item):
         """
-This method calls the equip_wand method on the subordinate Equipment object with
-the given argument.
+This method calls the equip_wand method on the subordinate Equipment object
+with the given argument, if it's in the character's inventory.
 
 :item:   A Wand object.
 :return: None.
         """
-        if not self.inventory.contains(item.internal_name):
-            raise excpt.Internal_Exception("equipping an `item` object that is not in the character's `inventory` object is "
-                                     'not allowed')
-        return self._equipment.equip_wand(item)
+        self._equip_generic('wand', item)
+
+    def _equip_generic(self, equipment_slot, item):
+        """
+This private method implements the equip_* methods. It raises an
+Internal_Exception if the given item isn't in the character's inventory, and
+otherwise calls the subordinate Equipment object's equip method for the given
+slot.
+
+:equipment_slot: A string, one of 'armor', 'shield', 'weapon', or 'wand'.
+:item:           An Equippable_Item subclass object.
+:return:         None.
+        """
+        self.inventory.require(item.internal_name)
+        _EQUIPMENT_EQUIP_METHODS[equipment_slot](self._equipment, item)
 
     def unequip_armor(self):
         """
@@ -1895,9 +2143,8 @@ equipments' armor bonuses and their Dexterity modifier.
 
 :return: An int.
         """
-        armor_class = self._equipment.armor_class
-        dexterity_mod = self.ability_scores.dexterity_mod
-        return armor_class + dexterity_mod
+        self._refresh_combat_caches()
+        return self._armor_class_cache
 
     @property
     def attack_bonus(self):
@@ -1909,23 +2156,29 @@ Intelligence for Mages wielding a wand).
 
 :return: An int.
         """
-        # A character with no weapon or wand has no attack bonus.
-        if (not (self._equipment.weapon_equipped
-                or self.character_class == 'Mage' and self._equipment.wand_equipped)):
+        # Only a Mage attacks with a wand; everyone else needs a weapon. A
+        # character with nothing to attack with has no attack bonus.
+        equipment = self._equipment
+        weapon = equipment.weapon
+        item_attacking_with = (equipment.wand if self.character_class == 'Mage' and equipment.wand is not None
+                               else weapon)
+        if item_attacking_with is None:
             raise excpt.Internal_Exception('The character does not have a weapon equipped; no valid value for '
                                      '`attack_bonus` can be computed.')
-        stat_dependency = self._attack_or_damage_stat_dependency()
-        # By the shield statement above, I know that the control flow getting
-        # here means that if no weapon is equipped a wand must be.
-        if self.character_class == 'Mage':
-            base_attack_bonus = (self._equipment.wand.attack_bonus if self._equipment.wand_equipped
-                             else self._equipment.weapon.attack_bonus)
-        else:
-            base_attack_bonus = self._equipment.weapon.attack_bonus
 
         # The attack bonus is drawn from the weapon or wand's attack bonus plus
         # the relevant stat mod.
-        return base_attack_bonus + getattr(self.ability_scores, stat_dependency + '_mod')
+        return item_attacking_with.attack_bonus + self._attack_stat_mod(weapon)
+
+
+# These are the creatures.ini keys that Creature passes to Character.__init__
+# as ints under the same names.
+_INT_STAT_KEYS = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma', 'base_hit_points')
+
+# This table maps each creatures.ini key that names an equipped item to the
+# Character method that equips it. Creature equips items in this order.
+_EQUIP_DISPATCH = {'weapon_equipped': Character.equip_weapon, 'armor_equipped': Character.equip_armor,
+                   'shield_equipped': Character.equip_shield, 'wand_equipped': Character.equip_wand}
 
 
 class Creature(Ini_Entry, Character):
@@ -1934,7 +2187,8 @@ This class uses multiple inheritance to subclass both Ini_Entry and Character.
 It is instantiated from an .ini file entry, but draws on all the game rules
 entity logic in Character to have access to the same mechanics as a character.
     """
-    __slots__ = ('internal_name', 'character_name', 'description', 'character_class', 'species', '_strength',
+    __slots__ = ('internal_name', 'character_name', 'title', 'description', 'description_dead', 'character_class',
+                 'species', '_strength',
                  '_dexterity', '_constitution', '_intelligence', '_wisdom', '_charisma', '_items_state',
                  '_base_hit_points', '_weapon_equipped', '_armor_equipped', '_shield_equipped')
 
@@ -1957,7 +2211,6 @@ its inventory, and sets up its equipment from its ini file data.
         character_init_argd, ini_entry_init_argd, equipment_argd, inventory_qty_name_pairs = \
             self._separate_argd_into_different_arg_sets(items_state, internal_name, **argd)
         Ini_Entry.__init__(self, internal_name=internal_name, **ini_entry_init_argd)
-        self._post_init_slots_set_none(self.__slots__)
         Character.__init__(self, **character_init_argd)
 
         # The Ini_Entry.__init__ and Character.__init__ steps are complete.
@@ -1984,34 +2237,23 @@ quantity-internal name pairs, and an equipment dict.
         # Character's __init__ args are formed first. dict.pop is used so
         # this step removes those values from argd as they're added to
         # character_init_argd.
-        character_init_argd = dict(strength=int(argd.pop('strength')),
-                                   dexterity=int(argd.pop('dexterity')),
-                                   constitution=int(argd.pop('constitution')),
-                                   intelligence=int(argd.pop('intelligence')),
-                                   wisdom=int(argd.pop('wisdom')),
-                                   charisma=int(argd.pop('charisma')),
-                                   base_hit_points=int(argd.pop('base_hit_points')),
-                                   character_name_str=argd.pop('character_name'),
+        character_init_argd = {ini_key: int(argd.pop(ini_key)) for ini_key in _INT_STAT_KEYS}
+        character_init_argd.update(character_name_str=argd.pop('character_name'),
                                    character_class_str=argd.pop('character_class'),
                                    base_mana_points=int(argd.pop('base_mana_points', 0)),
                                    magic_key_stat=argd.pop('magic_key_stat', None))
         # Equipment argd is next, *_equipped key-values are popped from argd and
         # added to equipment_argd.
-        equipment_argd = dict()
-        for ini_key in ('weapon_equipped', 'armor_equipped', 'shield_equipped', 'wand_equipped'):
-            if ini_key not in argd:
-                continue
-            equipment_argd[ini_key] = argd.pop(ini_key)
+        equipment_argd = {ini_key: argd.pop(ini_key) for ini_key in _EQUIP_DISPATCH if ini_key in argd}
         # The item quantity/internal_name pairs are unpacked from
         # 'inventory_items' using _process_list_value, which is inherited from
         # Ini_Entry and uses the standard item qty/name compact notation.
         inventory_qty_name_pairs = self._process_list_value(argd.pop('inventory_items'))
 
         # If any item internal names don't occur in items_state an exception is raised.
-        if any(not items_state.contains(inventory_internal_name)
-               for _, inventory_internal_name in inventory_qty_name_pairs):
-            missing_names = tuple(item_internal_name for _, item_internal_name in inventory_qty_name_pairs
-                                  if not items_state.contains(item_internal_name))
+        missing_names = [item_internal_name for _, item_internal_name in inventory_qty_name_pairs
+                         if not items_state.contains(item_internal_name)]
+        if missing_names:
             pluralizer = 's' if len(missing_names) > 1 else ''
             raise excpt.Internal_Exception(f'bad creatures.ini specification for creature {internal_name}: creature '
                                      f'ini config dict `inventory_items` value indicated item{pluralizer}'
@@ -2044,18 +2286,11 @@ inventory and equipped items.
         # if they're there. If any points to an object not in inventory an
         # exception is raised.
         for equipment_key, item_internal_name in equipment_argd.items():
-            if not items_state.contains(item_internal_name):
+            item = items_state.try_get(item_internal_name)
+            if item is None:
                 raise excpt.Internal_Exception(f'bad creatures.ini specification for creature {self.internal_name}: items '
                                          f'index object does not contain an item named {item_internal_name}')
-            item = items_state.get(item_internal_name)
-            if equipment_key == 'weapon_equipped':
-                self.equip_weapon(item)
-            elif equipment_key == 'armor_equipped':
-                self.equip_armor(item)
-            elif equipment_key == 'shield_equipped':
-                self.equip_shield(item)
-            else:  # by exclusion, the value must be 'wand_equipped'
-                self.equip_wand(item)
+            _EQUIP_DISPATCH[equipment_key](self, item)
 
     def convert_to_corpse(self):
         """
@@ -2071,8 +2306,7 @@ corpse).
         corpse = Corpse(self._items_state, internal_name, container_type='corpse',
                             description=description, title=title)
         # The items in inventory are saved to the new Corpse object's contents.
-        for item_internal_name, (item_qty, item) in self.inventory.items():
-            corpse.set(item_internal_name, item_qty, item)
+        corpse.bulk_load(self.inventory)
         return corpse
 
 
@@ -2081,24 +2315,101 @@ class Creatures_State(State):
 This State subclass is instantiated from the sections attribute of an IniConfig
 object instantiated from creatures.ini.
     """
+    # The Creature objects are constructed lazily. Until a creature is first
+    # fetched, the _contents dict holds its raw .ini section dict under its
+    # internal name, so contains(), keys() and size() work unchanged; the
+    # accessors that hand out Creature objects construct them on demand and
+    # store them back in place of the dict.
+    __slots__ = '_items_state',
 
     def __init__(self, items_state, **dict_of_dicts):
         """
 This __init__ method accepts an items_state object and a **dict-of-dicts as
-offered by an IniConfig object's sections attribute. It instantiates and stores
-a Creature object for each section of the **dict-of-dicts. Unlike other *_State
-classes it doesn't use a subclassing_factory because the Creature class is not
-subclassed to delineate different types of creature.
+offered by an IniConfig object's sections attribute. It stores each section of
+the **dict-of-dicts to instantiate a Creature object from when that creature is
+first fetched. Unlike other *_State classes it doesn't use a subclassing_factory
+because the Creature class is not subclassed to delineate different types of
+creature.
+
+Because construction is deferred, a malformed creatures.ini section doesn't
+raise an exception here; it raises when that creature is first fetched. Every
+creature placed in a room is fetched by Room.__init__ when Rooms_State is
+built, so for those the error still surfaces when the game is loaded.
 
 :items_state:     An Items_State object.
 :**dict_of_dicts: A structure of internal name keys corresponding to dict values
                   which are key-value pairs to initialize an individual
                   Creature object with.
         """
-        self._contents = dict()
-        for creature_internal_name, creature_dict in dict_of_dicts.items():
-            creature = Creature(items_state, internal_name=creature_internal_name, **creature_dict)
-            self.set(creature.internal_name, creature)
+        self._items_state = items_state
+        self._contents = dict(zip(map(sys.intern, dict_of_dicts.keys()), dict_of_dicts.values()))
+
+    def get(self, creature_internal_name):
+        """
+This accessor method returns the Creature object with the given internal name,
+instantiating it first if this is the first time it's been fetched. If it's not
+present the internal dict raises a KeyError.
+
+:creature_internal_name: The internal name of the Creature object.
+:return:                 A Creature object.
+        """
+        creature = self._contents[creature_internal_name]
+        if isinstance(creature, dict):
+            creature = self._contents[creature_internal_name] = Creature(
+                self._items_state, internal_name=creature_internal_name, **creature)
+        return creature
+
+    def try_get(self, creature_internal_name):
+        """
+This accessor method returns the Creature object with the given internal name,
+instantiating it first if need be, or None if it's not present.
+
+:creature_internal_name: The internal name of the Creature object.
+:return:                 A Creature object, or None.
+        """
+        if creature_internal_name not in self._contents:
+            return None
+        return self.get(creature_internal_name)
+
+    def values(self):
+        """
+This method instantiates any Creature objects not yet fetched and returns the
+internal dictionary's values iterator.
+
+:return: A dict_values object.
+        """
+        self._instantiate_all()
+        return self._contents.values()
+
+    def items(self):
+        """
+This method instantiates any Creature objects not yet fetched and returns the
+internal dictionary's items iterator.
+
+:return: A dict_items object.
+        """
+        self._instantiate_all()
+        return self._contents.items()
+
+    def _instantiate_all(self):
+        """
+This private method instantiates every Creature object whose .ini section
+dict is still stored in the internal dict.
+
+:return: None.
+        """
+        for creature_internal_name in [creature_internal_name
+                                       for creature_internal_name, creature in self._contents.items()
+                                       if isinstance(creature, dict)]:
+            self.get(creature_internal_name)
+
+
+# For each compass direction, in the order Room.doors lists them, this is the
+# direction, the name of the Room attribute that holds its door, and the titles
+# a Doorway or another Door subclass object there is given. It's built once here
+# so that Room.__init__ doesn't format the same strings for every room.
+_DOOR_ATTRS = tuple((compass_dir, f'{compass_dir}_door', f'{compass_dir} doorway', f'{compass_dir} door')
+                    for compass_dir in ('north', 'east', 'south', 'west'))
 
 
 class Room(Ini_Entry):
@@ -2109,43 +2420,49 @@ dict-of-dicts sections attribute.
     """
     __slots__ = ('internal_name', 'title', 'description', 'north_door', 'west_door', 'south_door', 'east_door',
                  'occupant', 'item', 'is_entrance', 'is_exit', '_containers_state', '_creatures_state',
-                 '_doors_state', '_items_state', 'creature_here', 'container_here', 'items_here')
+                 '_doors_state', '_items_state', 'creature_here', 'container_here', 'items_here', '_doors_cache',
+                 '_exit_destinations')
+
+    # Ini_Entry.__init__ sets every slot to None before applying the .ini
+    # values, and Room.__init__ turns an empty value such as 'north_door=' into
+    # None as well, so a *_door slot is always set and is None only if there's
+    # no door that way.
 
     @property
     def has_north_door(self):
         """
-This property returns True if the object has a nonempty north_door value, False otherwise.
+This property returns True if the object has a north_door value, False otherwise.
 
 :return: A boolean.
         """
-        return bool(getattr(self, 'north_door', False))
+        return self.north_door is not None
 
     @property
     def has_east_door(self):
         """
-This property returns True if the object has a nonempty east_door value, False otherwise.
+This property returns True if the object has a east_door value, False otherwise.
 
 :return: A boolean.
         """
-        return bool(getattr(self, 'east_door', False))
+        return self.east_door is not None
 
     @property
     def has_south_door(self):
         """
-This property returns True if the object has a nonempty south_door value, False otherwise.
+This property returns True if the object has a south_door value, False otherwise.
 
 :return: A boolean.
         """
-        return bool(getattr(self, 'south_door', False))
+        return self.south_door is not None
 
     @property
     def has_west_door(self):
         """
-This property returns True if the object has a nonempty west_door value, False otherwise.
+This property returns True if the object has a west_door value, False otherwise.
 
 :return: A boolean.
         """
-        return bool(getattr(self, 'west_door', False))
+        return self.west_door is not None
 
     def __init__(self, creatures_state, containers_state, doors_state, items_state, **argd):
         """
@@ -2163,27 +2480,35 @@ items_here and the {compass_dir}_door attributes.
                    with.
         """
         super().__init__(**argd)
+        # Ini_Entry.__init__ already casts 'true' and 'false' to booleans, but
+        # leaves is_entrance and is_exit None when a room omits them; I make
+        # them plain booleans once here so every later read is a slot load of
+        # True or False. _ini_flag() is the same rule Rooms_State.__init__ uses
+        # to find the entrance, so the two always agree.
+        self.is_entrance = _ini_flag(self.is_entrance)
+        self.is_exit = _ini_flag(self.is_exit)
         self._containers_state = containers_state
         self._creatures_state = creatures_state
         self._items_state = items_state
         self._doors_state = doors_state
-        self._post_init_slots_set_none(self.__slots__)
         # If a creature_here attribute is set, that value is taken as an
         # internal_name, looked up in creatures_state, and the matching creature
         # is saved to creature_here.
         if self.creature_here:
-            if not self._creatures_state.contains(self.creature_here):
+            creature = self._creatures_state.try_get(self.creature_here)
+            if creature is None:
                 raise excpt.Internal_Exception(f"room obj `{self.internal_name}` creature_here value '{self.creature_here}' "
                                          "doesn't correspond to any creatures in creatures_state store")
-            self.creature_here = self._creatures_state.get(self.creature_here)
+            self.creature_here = creature
         # If a container_here attribute is set, that value is taken as an
         # internal_name, looked up in containers_state, and the matching container
         # is saved to container_here.
         if self.container_here:
-            if not self._containers_state.contains(self.container_here):
+            container = self._containers_state.try_get(self.container_here)
+            if container is None:
                 raise excpt.Internal_Exception(f"room obj `{self.internal_name}` container_here value '{self.container_here}'"
                                          " doesn't correspond to any creatures in creatures_state store")
-            self.container_here = self._containers_state.get(self.container_here)
+            self.container_here = container
         # If an items_here attribute is set, it's parsed as the
         # compact item quantity/internal_name as interpretable by
         # Ini_Entry._process_list_value(), and the resultant Items_Multi_State
@@ -2195,20 +2520,28 @@ items_here and the {compass_dir}_door attributes.
                 item = self._items_state.get(item_internal_name)
                 items_state.set(item_internal_name, item_qty, item)
             self.items_here = items_state
-        for compass_dir in ('north', 'east', 'south', 'west'):
-            door_attr = f'{compass_dir}_door'
-            if not getattr(self, door_attr, False):
+        # The doors are only ever assigned here, so I collect them as they're
+        # set up and the doors property can return the finished tuple as is.
+        #
+        # Likewise which room each door leads to never changes, so the door
+        # and the internal name of the room on its other side are saved in
+        # _exit_destinations under the compass direction for Rooms_State.move().
+        doors_list = []
+        self._exit_destinations = exit_destinations = {}
+        for compass_dir, door_attr, doorway_title, door_title in _DOOR_ATTRS:
+            door_room_internal_name = getattr(self, door_attr)
+            if not door_room_internal_name:
+                setattr(self, door_attr, None)
                 continue
-            sorted_pair = tuple(sorted((self.internal_name, getattr(self, door_attr))))
-            if sorted_pair[0].lower() == 'exit':
-                sorted_pair = tuple(reversed(sorted_pair))
-
             # The Door objects stored in each Room object are not identical with the Door objects in
             # self._doors_state because each Door gets a new title based on its compass direction; the same Door can
             # be titled 'north door' in the southern of the two rooms it connects and 'south door' in the northern one.
-            door = self._doors_state.get(*sorted_pair).copy()
-            door.title = f'{compass_dir} doorway' if door.title == 'doorway' else f'{compass_dir} door'
+            door = self._doors_state.get(self.internal_name, door_room_internal_name).copy()
+            door.title = doorway_title if door.title == 'doorway' else door_title
             setattr(self, door_attr, door)
+            doors_list.append(door)
+            exit_destinations[compass_dir] = door, door.other_room_internal_name(self.internal_name)
+        self._doors_cache = tuple(doors_list)
 
     @property
     def doors(self):
@@ -2218,15 +2551,14 @@ this Room object.
 
 :return: A tuple of Door objects.
         """
-        doors_tuple = ()
-        # This method is just a shorthand for accessing the
-        # has_(north|south|east|west)_door attributes.
-        for compass_dir in ('north', 'east', 'south', 'west'):
-            has_door_property = f'has_{compass_dir}_door'
-            if not getattr(self, has_door_property):
-                continue
-            doors_tuple += getattr(self, f'{compass_dir}_door'),
-        return doors_tuple
+        return self._doors_cache
+
+
+# This table maps each compass direction that Rooms_State.move() accepts to the
+# uppercase direction used in its no-exit error message, and the door's name as
+# used in its locked-door error message.
+_MOVE_EXITS = {compass_dir: (compass_dir.upper(), f'{compass_dir} door')
+               for compass_dir in ('north', 'east', 'south', 'west')}
 
 
 class Rooms_State(object):
@@ -2234,7 +2566,7 @@ class Rooms_State(object):
 This class implements a state object that tracks the entire dungeon's layout.
     """
     __slots__ = ('_creatures_state', '_containers_state', '_items_state', '_doors_state',
-                 '_rooms_objs', '_room_cursor')
+                 '_rooms_objs', '_room_cursor', '_cursor_obj')
 
     @property
     def cursor(self):
@@ -2244,7 +2576,7 @@ player to currently be occupying.
 
 :return: A Room object.
         """
-        return self._rooms_objs[self._room_cursor]
+        return self._cursor_obj
 
     def __init__(self, creatures_state, containers_state, doors_state, items_state, **dict_of_dicts):
         """
@@ -2266,15 +2598,31 @@ IniConfig's sections attribute.
         self._containers_state = containers_state
         self._doors_state = doors_state
         self._items_state = items_state
+        # The cursor starts at the room marked is_entrance=true. It's found by
+        # scanning the .ini section dicts before any Room object is built, with
+        # the same _ini_flag() rule Room.__init__ applies, and exactly one room
+        # must be so marked.
+        #
+        # The room internal names are interned, as Door interns the names of
+        # the rooms it links, so the _rooms_objs lookups in move() compare keys
+        # by identity.
+        rooms_names_and_dicts = tuple(zip(map(sys.intern, dict_of_dicts.keys()), dict_of_dicts.values()))
+        entrance_names = [room_internal_name for room_internal_name, room_dict in rooms_names_and_dicts
+                          if _ini_flag(room_dict.get('is_entrance'))]
+        if len(entrance_names) != 1:
+            raise excpt.Internal_Exception('exactly one room must have is_entrance set to true, found '
+                                           f'{len(entrance_names)}: ' + ', '.join(entrance_names))
+        self._room_cursor, = entrance_names
         # The Room objects contained by this object are initialized from
         # **dict_of_dicts.
-        for room_internal_name, room_dict in dict_of_dicts.items():
+        for room_internal_name, room_dict in rooms_names_and_dicts:
             room = Room(creatures_state, containers_state, doors_state, items_state,
                             internal_name=room_internal_name, **room_dict)
-            # The cursor is set to the room identifies by is_entrance=True
-            if room.is_entrance:
-                self._room_cursor = room.internal_name
-            self.set(room.internal_name, room)
+            self.set(room_internal_name, room)
+        # The Room object the cursor points to is kept in _cursor_obj alongside
+        # its internal name, so the cursor property doesn't need a dict lookup.
+        # move() updates both.
+        self._cursor_obj = self._rooms_objs[self._room_cursor]
 
     def get(self, internal_name):
         """
@@ -2297,51 +2645,43 @@ internal name.
         """
         self._rooms_objs[internal_name] = room
 
-    def move(self, north=False, west=False, south=False, east=False):
+    def move(self, direction):
         """
 This method directs the Rooms_State object to move the cursor from the current
 room to an adjacent room by the given compass direction.
 
-:north:  A boolean, True if movement to the north is intended, False otherwise.
-:east:   A boolean, True if movement to the east is intended, False otherwise.
-:south:  A boolean, True if movement to the south is intended, False otherwise.
-:west:   A boolean, True if movement to the west is intended, False otherwise.
-:return: None.
-        """
-        # If more than one of north, east, south and west are True, raise an
-        # exception.
-        if ((north and west) or (north and south) or (north and east) or (west and south)
-                or (west and east) or (south and east)):
-            raise excpt.Internal_Exception('move() must receive only *one* True argument of the four keys `north`, `south`, '
-                                     '`east` and `west`')
-        if north:
-            exit_name = 'north_door'
-            exit_key = 'NORTH'
-        elif west:
-            exit_name = 'west_door'
-            exit_key = 'WEST'
-        elif south:
-            exit_name = 'south_door'
-            exit_key = 'SOUTH'
-        elif east:
-            exit_name = 'east_door'
-            exit_key = 'EAST'
-        # If the Room doesn't have a matching exit, an exception is raised.
-        if not getattr(self.cursor, exit_name):
+:direction: A string, one of 'north', 'east', 'south' or 'west'.
+:return:    None.
+        """
+        # The direction is looked up in _MOVE_EXITS for the names used for it
+        # in error messages. Any other direction is an error.
+        move_exit = _MOVE_EXITS.get(direction)
+        if move_exit is None:
+            raise excpt.Internal_Exception(f"move() direction argument '{direction}' not one of 'north', 'east', "
+                                           "'south' or 'west'")
+        exit_key, exit_title = move_exit
+        # The current Room object is fetched once rather than through the
+        # cursor property at each use.
+        room = self._cursor_obj
+        # The Room's exit table holds the Door object that way and the internal
+        # name of the room on its other side. If the Room doesn't have a
+        # matching exit, an exception is raised.
+        room_exit = room._exit_destinations.get(direction)
+        if room_exit is None:
             raise excpt.Bad_Command_Exception('MOVE', f'This room has no <{exit_key}> exit.')
-        door = getattr(self.cursor, exit_name)
+        door, other_room_internal_name = room_exit
 
-        # If the Door object has is_locked=True, an exception is raised.
+        # If the Door object has is_locked=True, an exception is raised. This is
+        # checked here rather than stored in the exit table because the
+        # processor locks and unlocks doors by setting is_locked directly.
         if door.is_locked:
-            raise excpt.Internal_Exception(f'exiting {self.cursor.internal_name} via the {exit_name.replace("_"," ")}: door '
-                                      'is locked')
+            raise excpt.Internal_Exception(f'exiting {room.internal_name} via the {exit_title}: door is locked')
 
-        # The Door object returns the other Room object it connects to; the
-        # value for cursor is updated by setting _room_cursor to that Room
-        # object's internal_name.
-        other_room_internal_name = door.other_room_internal_name(self.cursor.internal_name)
+        # The value for cursor is updated by setting _room_cursor to the other
+        # Room object's internal_name and _cursor_obj to the Room object itself.
         new_room_dest = self._rooms_objs[other_room_internal_name]
         self._room_cursor = new_room_dest.internal_name
+        self._cursor_obj = new_room_dest
 
 
 class Game_State(object):
@@ -2351,50 +2691,10 @@ AdventureGame. It is the top-level object, and stores a items_state object,
 a doors_state object, a containers_state object, a creatures_state object, a
 rooms_state object, and (once it can be instantiated) a character object.
     """
-    __slots__ = ('_character_name', '_character_class', 'character', 'rooms_state', 'containers_state',
-                 'doors_state', 'items_state', 'creatures_state', 'game_has_begun', 'game_has_ended')
-
-    @property
-    def character_name(self):
-        """
-This property returns the character name.
-
-:return: A string.
-        """
-        return self._character_name
-
-    @character_name.setter
-    def character_name(self, name_str):
-        """
-This property sets the character name, and contains a hook to attempt to
-instantiate the character object if both the name and class have been set.
-
-:name_str: A string, the character name.
-:return:   None.
-        """
-        setattr(self, '_character_name', name_str)
-        self._incept_character_obj_if_possible()
-
-    @property
-    def character_class(self):
-        """
-This property returns the character class.
-
-:return: A string, one of 'Warrior', 'Thief', 'Mage', or 'Priest'.
-        """
-        return self._character_class
-
-    @character_class.setter
-    def character_class(self, class_str):
-        """
-This property sets the character class, and contains a hook to attempt to
-instantiate the character object if both the name and class have been set.
-
-:name_str: A string, the character class.
-:return:   None.
-        """
-        setattr(self, '_character_class', class_str)
-        self._incept_character_obj_if_possible()
+    # The slots are listed with the attributes the processor reads on nearly
+    # every command first.
+    __slots__ = ('character', 'rooms_state', 'game_has_begun', 'game_has_ended', 'items_state', 'containers_state',
+                 'creatures_state', 'doors_state', 'character_name', 'character_class')
 
     def __init__(self, rooms_state, creatures_state, containers_state, doors_state, items_state):
         """
@@ -2413,24 +2713,28 @@ its arguments.
         self.containers_state = containers_state
         self.creatures_state = creatures_state
         self.rooms_state = rooms_state
-        self._character_name = None
-        self._character_class = None
+        self.character_name = None
+        self.character_class = None
         self.game_has_begun = False
         self.game_has_ended = False
         self.character = None
 
-    # The Character object can't be instantiated until the `character_name`
-    # and `character_class` attributes are set, but that happens after
-    # initialization; so the `character_name` and `character_class` setters call
-    # this method prospectively each time either is called to check if both have
-    # been set and `Character` object instantiation can proceed.
-    def _incept_character_obj_if_possible(self):
+    # The Character object can't be instantiated until both the character name
+    # and the character class are known, but those are set one at a time by
+    # separate commands after initialization; so the code that sets either one
+    # calls this method with both, and it instantiates the Character object
+    # once both have been supplied.
+    def start_character(self, character_name, character_class):
         """
-This private method is called by the character_name and character_class property
-setters, and it instantiates the Character object if both the character name and
-the character class have been set.
+This method sets the character name and the character class, and instantiates
+the Character object if both have been set and it doesn't exist yet.
 
-:return: None.
+:character_name:  A string, the character name, or None if it's not set yet.
+:character_class: A string, one of 'Warrior', 'Thief', 'Mage', or 'Priest', or
+                  None if it's not set yet.
+:return:          None.
         """
-        if self.character is None and getattr(self, 'character_name', None) and getattr(self, 'character_class', None):
-            self.character = Character(self.character_name, self.character_class)
+        self.character_name = character_name
+        self.character_class = character_class
+        if self.character is None and character_name and character_class:
+            self.character = Character(character_name, character_class)
@@ -1325,7 +1325,7 @@ LEAVE [USING or VIA] <compass direction> <door name>
 
         # Otherwise, Rooms_State.move is called with the compass direction, and
         # a left-room value is returned along with a entered-room value.
-        self.game_state.rooms_state.move(**{compass_dir: True})
+        self.game_state.rooms_state.move(compass_dir)
         return (stmsg.Leave_Command_Left_Room(compass_dir, portal_type),
                 stmsg.Various_Commands_Entered_Room(self.game_state.rooms_state.cursor))
 
@@ -2623,7 +2623,7 @@ SET CLASS [TO] <Warrior, Thief, Mage or Priest>
         # time this command is used, and set the class.
         class_str = tokens[0]
         class_was_none = self.game_state.character_class is None
-        self.game_state.character_class = class_str
+        self.game_state.start_character(self.game_state.character_name, class_str)
 
         # If character name was already set and this is the first setting of
         # character class, the Character object will have been initialized as a
@@ -2684,7 +2684,7 @@ SET NAME [TO] <character name>
         # If the name wasn't set before this call, I save that fact, then set the character name.
         name_was_none = self.game_state.character_name is None
         name_str = ' '.join(tokens)
-        self.game_state.character_name = ' '.join(tokens)
+        self.game_state.start_character(name_str, self.game_state.character_class)
 
         # If the character class is set and this command is the first time the
         # name has been set, that means that self.game_state has instantiated a
@@ -5,4 +5,14 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import iniconfig
+
 import adventuregame
+
+# The testing data files are parsed here once, and the test modules import the
+# resulting IniConfig objects instead of each parsing the same files.
+containers_ini_config = iniconfig.IniConfig('./testing_data/containers.ini')
+items_ini_config = iniconfig.IniConfig('./testing_data/items.ini')
+doors_ini_config = iniconfig.IniConfig('./testing_data/doors.ini')
+creatures_ini_config = iniconfig.IniConfig('./testing_data/creatures.ini')
+rooms_ini_config = iniconfig.IniConfig('./testing_data/rooms.ini')
@@ -3,19 +3,12 @@
 import operator
 import unittest
 
-import iniconfig
-
 from .context import adventuregame as advg
+from .context import containers_ini_config, creatures_ini_config, doors_ini_config, items_ini_config, rooms_ini_config
 
 
 __name__ = 'tests.test_commands'
 
-containers_ini_config = iniconfig.IniConfig('./testing_data/containers.ini')
-items_ini_config = iniconfig.IniConfig('./testing_data/items.ini')
-doors_ini_config = iniconfig.IniConfig('./testing_data/doors.ini')
-creatures_ini_config = iniconfig.IniConfig('./testing_data/creatures.ini')
-rooms_ini_config = iniconfig.IniConfig('./testing_data/rooms.ini')
-
 
 class Test_Attack_1(unittest.TestCase):
 
@@ -33,8 +26,7 @@ class Test_Attack_1(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.game_state.character_name = 'Niath'
-        self.game_state.character_class = 'Warrior'
+        self.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.game_state.character.pick_up_item(self.items_state.get('Longsword'))
         self.game_state.character.pick_up_item(self.items_state.get('Studded_Leather'))
@@ -152,8 +144,7 @@ class Test_Attack_2(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.game_state.character_name = 'Mialee'
-        self.game_state.character_class = 'Mage'
+        self.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         self.game_state.character.pick_up_item(self.items_state.get('Magic_Wand'))
         self.game_state.character.equip_wand(self.items_state.get('Magic_Wand'))
@@ -370,8 +361,7 @@ class Test_Cast_Spell(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
 
     def test_cast_spell1(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('cast spell')
         self.assertIsInstance(result[0], advg.Command_Class_Restricted)
@@ -380,8 +370,7 @@ class Test_Cast_Spell(unittest.TestCase):
         self.assertEqual(result[0].message, 'Only mages and priests can use the CAST SPELL command.')
 
     def test_cast_spell2(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         for bad_argument_str in ('cast spell at kobold', 'cast spell at',):
             result = self.command_processor.process(bad_argument_str)
@@ -390,8 +379,7 @@ class Test_Cast_Spell(unittest.TestCase):
             self.assertEqual(result[0].message, "CAST SPELL command: bad syntax. Should be 'CAST\u00A0SPELL'.")
 
     def test_cast_spell3(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_point_total = self.command_processor.game_state.character.mana_point_total
         mana_spending_outcome = self.command_processor.game_state.character.spend_mana(mana_point_total - 4)
@@ -407,8 +395,7 @@ class Test_Cast_Spell(unittest.TestCase):
                                             f'{current_mana_points}/{mana_point_total}.')
 
     def test_cast_spell4(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('cast spell')
         self.assertIsInstance(result[0], advg.Cast_Spell_Command_Cast_Damaging_Spell)
@@ -432,8 +419,7 @@ class Test_Cast_Spell(unittest.TestCase):
                          self.command_processor.game_state.character.mana_point_total)
 
     def test_cast_spell5(self):
-        self.command_processor.game_state.character_name = 'Kaeva'
-        self.command_processor.game_state.character_class = 'Priest'
+        self.command_processor.game_state.start_character('Kaeva', 'Priest')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('cast spell')
         self.assertIsInstance(result[0], advg.Cast_Spell_Command_Cast_Healing_Spell)
@@ -459,8 +445,7 @@ class Test_Close(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.chest = self.command_processor.game_state.rooms_state.cursor.container_here
         self.chest.is_closed = True
@@ -555,7 +540,7 @@ class Test_Close(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't close the kobold corpse; corpses are not closable."),
 
     def test_close_12(self):
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('close east doorway')
         self.assertIsInstance(result[0], advg.Close_Command_Element_Not_Closable)
         self.assertEqual(result[0].target_title, 'east doorway')
@@ -563,8 +548,7 @@ class Test_Close(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't close the east doorway; doorways are not closable.")
 
     def test_open_13(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         studded_leather_armor = self.items_state.get('Studded_Leather')
         self.command_processor.game_state.character.pick_up_item(studded_leather_armor)
@@ -593,8 +577,7 @@ class Test_Drink(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
 
     def test_drink1(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         for bad_argument_str in ('drink', 'drink the', 'drink 2 mana potion', 'drink 1 mana potions'):
             result = self.command_processor.process(bad_argument_str)
@@ -605,8 +588,7 @@ class Test_Drink(unittest.TestCase):
                                                 "'DRINK\u00A0<number>\u00A0<potion\u00A0name>(s)'.")
 
     def test_drink2(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('drink health potion')
         self.assertIsInstance(result[0], advg.Drink_Command_Item_Not_in_Inventory)
@@ -614,8 +596,7 @@ class Test_Drink(unittest.TestCase):
         self.assertEqual(result[0].message, "You don't have a health potion in your inventory.")
 
     def test_drink3(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         health_potion = self.command_processor.game_state.items_state.get('Health_Potion')
         self.command_processor.game_state.character.pick_up_item(health_potion)
@@ -627,8 +608,7 @@ class Test_Drink(unittest.TestCase):
                                             r'(\d+)/\1.')
 
     def test_drink4(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         health_potion = self.command_processor.game_state.items_state.get('Health_Potion')
         self.command_processor.game_state.character.pick_up_item(health_potion)
@@ -640,8 +620,7 @@ class Test_Drink(unittest.TestCase):
         self.assertRegex(result[0].message, r'You regained 20 hit points. Your hit points are (?!(\d+)/\1)\d+/\d+.')
 
     def test_drink5(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         health_potion = self.command_processor.game_state.items_state.get('Health_Potion')
         self.command_processor.game_state.character.pick_up_item(health_potion)
@@ -651,8 +630,7 @@ class Test_Drink(unittest.TestCase):
         self.assertRegex(result[0].message, r"You didn't regain any hit points. You're fully healed! Your hit points are \d+/\d+.")
 
     def test_drink6(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -665,8 +643,7 @@ class Test_Drink(unittest.TestCase):
                                             r'points are (\d+)/\1.')
 
     def test_drink7(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         mana_potion.mana_points_recovered = 11
@@ -679,8 +656,7 @@ class Test_Drink(unittest.TestCase):
         self.assertRegex(result[0].message, r'You regained 11 mana points. Your mana points are (?!(\d+)/\1)\d+/\d+.')
 
     def test_drink8(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -691,8 +667,7 @@ class Test_Drink(unittest.TestCase):
         self.assertRegex(result[0].message, r"You didn't regain any mana points. You have full mana points! Your mana points are (\d+)/\1.")
 
     def test_drink9(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -701,8 +676,7 @@ class Test_Drink(unittest.TestCase):
         self.assertEqual(result[0].message, 'You feel a little strange, but otherwise nothing happens.')
 
     def test_drink10(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.command_processor.game_state.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin)
@@ -711,8 +685,7 @@ class Test_Drink(unittest.TestCase):
         self.assertEqual(result[0].message, 'A gold coin is not drinkable.')
 
     def test_drink11(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -721,8 +694,7 @@ class Test_Drink(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't drink 3 mana potions. You only have 1 of them.")
 
     def test_drink12(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -731,8 +703,7 @@ class Test_Drink(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't drink 3 mana potions. You only have 1 of them.")
 
     def test_drink13(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         mana_potion = self.command_processor.game_state.items_state.get('Mana_Potion')
         self.command_processor.game_state.character.pick_up_item(mana_potion)
@@ -759,8 +730,7 @@ class Test_Drop(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
 
     def test_drop_1(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -771,8 +741,7 @@ class Test_Drop(unittest.TestCase):
                                             "'DROP\u00A0<number>\u00A0<item\u00A0name>'."),
 
     def test_drop_2(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -781,8 +750,7 @@ class Test_Drop(unittest.TestCase):
         self.assertEqual(result[0].message, 'Amount to drop unclear. How many do you mean?')
 
     def test_drop_3(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -793,8 +761,7 @@ class Test_Drop(unittest.TestCase):
         self.assertEqual(result[0].message, "You don't have a mana potion in your inventory.")
 
     def test_drop_4(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -807,8 +774,7 @@ class Test_Drop(unittest.TestCase):
                                             'inventory.')
 
     def test_drop_5(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -821,8 +787,7 @@ class Test_Drop(unittest.TestCase):
                                             'inventory.')
 
     def test_drop_6(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -845,8 +810,7 @@ class Test_Drop(unittest.TestCase):
                                             'coin left.')
 
     def test_drop_7(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -861,8 +825,7 @@ class Test_Drop(unittest.TestCase):
                                             'coins left.')
 
     def test_drop_8(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         gold_coin = self.items_state.get('Gold_Coin')
         self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
@@ -876,8 +839,7 @@ class Test_Drop(unittest.TestCase):
                                             'gold coins left.')
 
     def test_drop_9(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         longsword = self.items_state.get('Longsword')
         self.command_processor.game_state.character.pick_up_item(longsword)
@@ -896,8 +858,7 @@ class Test_Drop(unittest.TestCase):
                                             'left.')
 
     def test_drop_10(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         steel_shield = self.items_state.get('Steel_Shield')
         self.command_processor.game_state.character.pick_up_item(steel_shield)
@@ -916,8 +877,7 @@ class Test_Drop(unittest.TestCase):
                                             ' shields left.')
 
     def test_drop_11(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         magic_wand = self.items_state.get('Magic_Wand')
         self.command_processor.game_state.character.pick_up_item(magic_wand)
@@ -936,8 +896,7 @@ class Test_Drop(unittest.TestCase):
                                             'magic wands left.')
 
     def test_drop_12(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         staff = self.items_state.get('Staff')
         self.command_processor.game_state.character.pick_up_item(staff)
@@ -959,8 +918,7 @@ class Test_Drop(unittest.TestCase):
                                             'magic wands left.')
 
     def test_drop_13(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         staff = self.items_state.get('Staff')
         self.command_processor.game_state.character.pick_up_item(staff)
@@ -984,8 +942,7 @@ class Test_Drop(unittest.TestCase):
                                             'staffs left.')
 
     def test_drop_14(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         longsword = self.items_state.get('Longsword')
         self.command_processor.game_state.character.pick_up_item(longsword, qty=3)
@@ -1000,8 +957,7 @@ class Test_Drop(unittest.TestCase):
                                             'left.')
 
     def test_drop_15(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         longsword = self.items_state.get('Longsword')
         self.command_processor.game_state.character.pick_up_item(longsword, qty=3)
@@ -1038,8 +994,7 @@ class Test_Equip_1(unittest.TestCase):
         self.magic_wand = self.command_processor.game_state.items_state.get('Magic_Wand')
         self.magic_wand_2 = self.command_processor.game_state.items_state.get('Magic_Wand_2')
         self.staff = self.command_processor.game_state.items_state.get('Staff')
-        self.command_processor.game_state.character_name = 'Arliss'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Arliss', 'Mage')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.pick_up_item(self.longsword)
         self.command_processor.game_state.character.pick_up_item(self.scale_mail)
@@ -1049,8 +1004,7 @@ class Test_Equip_1(unittest.TestCase):
         self.command_processor.game_state.character.pick_up_item(self.magic_wand_2)
 
     def test_equip_1(self):
-        self.command_processor.game_state.character_name = 'Arliss'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Arliss', 'Mage')
         self.game_state.game_has_begun = True
 
         result = self.command_processor.process('equip')
@@ -1148,8 +1102,7 @@ class Test_Equip_2(unittest.TestCase):
         self.scale_mail = self.command_processor.game_state.items_state.get('Scale_Mail')
         self.shield = self.command_processor.game_state.items_state.get('Steel_Shield')
         self.studded_leather = self.command_processor.game_state.items_state.get('Studded_Leather')
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.pick_up_item(self.mace)
         self.command_processor.game_state.character.pick_up_item(self.studded_leather)
@@ -1343,8 +1296,7 @@ class Test_Inventory(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         longsword = self.command_processor.game_state.items_state.get('Longsword')
         self.scale_mail = self.command_processor.game_state.items_state.get('Scale_Mail')
@@ -1397,8 +1349,7 @@ class Test_Leave(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
 
     def test_leave_1(self):
@@ -1452,8 +1403,7 @@ class Test_Leave(unittest.TestCase):
 
     def test_leave_5(self):
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.assertEqual(self.command_processor.game_state.rooms_state.cursor.title, 'southwest dungeon room')
         self.command_processor.process('leave using north door')
@@ -1490,8 +1440,7 @@ class Test_Lock(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.door = self.command_processor.game_state.rooms_state.cursor.north_door
         self.door.is_locked = True
@@ -1623,7 +1572,7 @@ class Test_Lock(unittest.TestCase):
 
     def test_lock_13(self):
         result = self.command_processor.process('pick lock on north door')
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('lock east doorway')
         self.assertIsInstance(result[0], advg.Lock_Command_Element_Not_Lockable)
         self.assertEqual(result[0].target_title, 'east doorway')
@@ -1656,8 +1605,7 @@ class Test_Look_At_1(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.game_state.character_name = 'Niath'
-        self.game_state.character_class = 'Warrior'
+        self.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.game_state.character.pick_up_item(self.items_state.get('Longsword'))
         self.game_state.character.pick_up_item(self.items_state.get('Studded_Leather'))
@@ -1825,8 +1773,7 @@ class Test_Look_At_2(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
 
     def test_look_at_1(self):
@@ -1982,7 +1929,7 @@ class Test_Look_At_2(unittest.TestCase):
         self.assertEqual(result[0].message, 'This room does not have a west door.')
 
     def test_look_at_16(self):
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('look at east doorway')
         self.assertIsInstance(result[0], advg.Look_At_Command_Found_Door_or_Doorway)
         self.assertEqual(result[0].compass_dir, 'east')
@@ -2055,8 +2002,7 @@ class Test_Open(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.chest = self.command_processor.game_state.rooms_state.cursor.container_here
         self.chest_title = self.chest.title
@@ -2175,7 +2121,7 @@ class Test_Open(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't open the kobold corpse; corpses are not openable."),
 
     def test_open_13(self):
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('open east doorway')
         self.assertIsInstance(result[0], advg.Open_Command_Element_Not_Openable)
         self.assertEqual(result[0].target_title, 'east doorway')
@@ -2183,8 +2129,7 @@ class Test_Open(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't open the east doorway; doorways are not openable.")
 
     def test_open_14(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         studded_leather_armor = self.items_state.get('Studded_Leather')
         self.command_processor.game_state.character.pick_up_item(studded_leather_armor)
@@ -2213,8 +2158,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
 
     def test_pick_lock_1(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on wooden chest')
         self.assertIsInstance(result[0], advg.Command_Class_Restricted)
@@ -2223,8 +2167,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'Only thieves can use the PICK LOCK command.')
 
     def test_pick_lock_2(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock')
         self.assertIsInstance(result[0], advg.Command_Bad_Syntax)
@@ -2240,8 +2183,7 @@ class Test_Pick_Lock(unittest.TestCase):
                                             "'PICK\u00A0LOCK\u00A0ON\u00A0[THE]\u00A0<door\u00A0name>'.")
 
     def test_pick_lock_3(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on west door')
         self.assertIsInstance(result[0], advg.Various_Commands_Door_Not_Present)
@@ -2250,8 +2192,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'This room does not have a west door.')
 
     def test_pick_lock_4(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on north iron door')
         self.assertIsInstance(result[0], advg.Pick_Lock_Command_Target_Not_Locked)
@@ -2259,8 +2200,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'The north iron door is not locked.')
 
     def test_pick_lock_5(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on north door')
         self.assertIsInstance(result[0], advg.Pick_Lock_Command_Target_Not_Locked)
@@ -2268,8 +2208,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'The north door is not locked.')
 
     def test_pick_lock_6(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.rooms_state.cursor.container_here = None
         result = self.command_processor.process('pick lock on wooden chest')
@@ -2278,8 +2217,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'This room has no wooden chest.')
 
     def test_pick_lock_7(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.rooms_state.cursor.container_here.is_locked = False
         result = self.command_processor.process('pick lock on wooden chest')
@@ -2289,8 +2227,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertFalse(self.command_processor.game_state.rooms_state.cursor.container_here.is_locked)
 
     def test_pick_lock_8(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.assertTrue(self.command_processor.game_state.rooms_state.cursor.east_door.is_locked)
         result = self.command_processor.process('pick lock on east door')
@@ -2300,8 +2237,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertFalse(self.command_processor.game_state.rooms_state.cursor.east_door.is_locked)
 
     def test_pick_lock_9(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.assertTrue(self.command_processor.game_state.rooms_state.cursor.east_door.is_locked)
         result = self.command_processor.process('pick lock on east door')
@@ -2316,8 +2252,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, 'The west door is not locked.')
 
     def test_pick_lock_10(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.assertTrue(self.command_processor.game_state.rooms_state.cursor.east_door.is_locked)
         result = self.command_processor.process('pick lock on east door')
@@ -2327,8 +2262,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertFalse(self.command_processor.game_state.rooms_state.cursor.east_door.is_locked)
 
     def test_pick_lock_11(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.assertTrue(self.command_processor.game_state.rooms_state.cursor.container_here.is_locked)
         result = self.command_processor.process('pick lock on wooden chest')
@@ -2338,8 +2272,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertFalse(self.command_processor.game_state.rooms_state.cursor.container_here.is_locked)
 
     def test_pick_lock_12(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on mana potion')
         self.assertIsInstance(result[0], advg.Pick_Lock_Command_Element_Not_Unlockable)
@@ -2348,8 +2281,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't pick a lock on the mana potion; potions are not unlockable."),
 
     def test_pick_lock_13(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('pick lock on kobold')
         self.assertIsInstance(result[0], advg.Pick_Lock_Command_Element_Not_Unlockable)
@@ -2358,8 +2290,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't pick a lock on the kobold; creatures are not unlockable."),
 
     def test_pick_lock_14(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.rooms_state.cursor.container_here = \
             self.command_processor.game_state.rooms_state.cursor.creature_here.convert_to_corpse()
@@ -2370,10 +2301,9 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't pick a lock on the kobold corpse; corpses are not unlockable."),
 
     def test_pick_lock_15(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('pick lock on east doorway')
         self.assertIsInstance(result[0], advg.Pick_Lock_Command_Element_Not_Unlockable)
         self.assertEqual(result[0].target_title, 'east doorway')
@@ -2381,8 +2311,7 @@ class Test_Pick_Lock(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't pick a lock on the east doorway; doorways are not unlockable.")
 
     def test_pick_lock_16(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         studded_leather_armor = self.items_state.get('Studded_Leather')
         self.command_processor.game_state.character.pick_up_item(studded_leather_armor)
@@ -2409,8 +2338,7 @@ class Test_Pick_Up(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
 
     def test_pick_up_1(self):
@@ -2453,14 +2381,14 @@ class Test_Pick_Up(unittest.TestCase):
                                             'mana potion here.')
 
     def test_pick_up_6(self):
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('pick up a short sword')  # check
         self.assertIsInstance(result[0], advg.Pick_Up_Command_Item_Not_Found)
         self.assertEqual(result[0].item_title, 'short sword')
         self.assertEqual(result[0].amount_attempted, 1)
         self.assertEqual(result[0].items_here, ())
         self.assertEqual(result[0].message, 'You see no short sword here.')
-        self.command_processor.game_state.rooms_state.move(south=True)
+        self.command_processor.game_state.rooms_state.move('south')
 
     def test_pick_up_7(self):
         result = self.command_processor.process('pick up 2 mana potions')  # check
@@ -2560,8 +2488,7 @@ class Test_Processor_Process(unittest.TestCase):
                                             'BEGIN GAME, HELP, QUIT, REROLL, SET CLASS, and SET NAME.')
 
     def test_command_not_recognized_during_game(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.command_processor.game_state.game_has_begun = True
         result = self.command_processor.process('juggle')
         self.assertIsInstance(result[0], advg.Command_Not_Recognized)
@@ -2584,8 +2511,7 @@ class Test_Processor_Process(unittest.TestCase):
                                             'game start are BEGIN GAME, HELP, QUIT, REROLL, SET CLASS, and SET NAME.')
 
     def test_command_not_allowed_during_game(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.command_processor.game_state.game_has_begun = True
         result = self.command_processor.process('reroll')
         self.assertIsInstance(result[0], advg.Command_Not_Allowed_Now)
@@ -2616,8 +2542,7 @@ class Test_Put(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.game_state.character_name = 'Niath'
-        self.game_state.character_class = 'Warrior'
+        self.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.game_state.character.pick_up_item(self.items_state.get('Longsword'))
         self.game_state.character.pick_up_item(self.items_state.get('Studded_Leather'))
@@ -3004,8 +2929,7 @@ class Test_Status(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
 
     def test_status1(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('status status')
         self.assertIsInstance(result[0], advg.Command_Bad_Syntax)
@@ -3013,8 +2937,7 @@ class Test_Status(unittest.TestCase):
         self.assertEqual(result[0].message, "STATUS command: bad syntax. Should be 'STATUS'.")
 
     def test_status2(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         longsword = self.command_processor.game_state.items_state.get('Longsword')
         self.scale_mail = self.command_processor.game_state.items_state.get('Scale_Mail')
@@ -3031,8 +2954,7 @@ class Test_Status(unittest.TestCase):
                                             r'Class: \d+ \| Weapon: [a-z ]+ - Armor: [a-z ]+ - Shield: [a-z ]+')
 
     def test_status3(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         staff = self.command_processor.game_state.items_state.get('Staff')
         self.magic_wand = self.command_processor.game_state.items_state.get('Magic_Wand')
@@ -3047,8 +2969,7 @@ class Test_Status(unittest.TestCase):
                                             r'[a-z ]+')
 
     def test_status4(self):
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('status')
         self.assertIsInstance(result[0], advg.Status_Command_Output)
@@ -3056,8 +2977,7 @@ class Test_Status(unittest.TestCase):
                                             r'equipped - Armor Class: \d+ \| Weapon: none - Wand: none')
 
     def test_status5(self):
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('status')
         self.assertIsInstance(result[0], advg.Status_Command_Output)
@@ -3065,8 +2985,7 @@ class Test_Status(unittest.TestCase):
                                             r'Weapon: none - Armor: none - Shield: none')
 
     def test_status6(self):
-        self.command_processor.game_state.character_name = 'Kaeva'
-        self.command_processor.game_state.character_class = 'Priest'
+        self.command_processor.game_state.start_character('Kaeva', 'Priest')
         self.game_state.game_has_begun = True
         result = self.command_processor.process('status')
         self.assertIsInstance(result[0], advg.Status_Command_Output)
@@ -3074,8 +2993,7 @@ class Test_Status(unittest.TestCase):
                                             r'- Armor Class: \d+ \| Weapon: none - Armor: none - Shield: none')
 
     def test_status7(self):
-        self.command_processor.game_state.character_name = 'Kaeva'
-        self.command_processor.game_state.character_class = 'Priest'
+        self.command_processor.game_state.start_character('Kaeva', 'Priest')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.take_damage(10)
         result = self.command_processor.process('status')
@@ -3085,8 +3003,7 @@ class Test_Status(unittest.TestCase):
                                              'Shield: none')
 
     def test_status8(self):
-        self.command_processor.game_state.character_name = 'Kaeva'
-        self.command_processor.game_state.character_class = 'Priest'
+        self.command_processor.game_state.start_character('Kaeva', 'Priest')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.spend_mana(10)
         result = self.command_processor.process('status')
@@ -3112,8 +3029,7 @@ class Test_Take(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.game_state.character_name = 'Niath'
-        self.game_state.character_class = 'Warrior'
+        self.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.game_state.character.pick_up_item(self.items_state.get('Longsword'))
         self.game_state.character.pick_up_item(self.items_state.get('Studded_Leather'))
@@ -3519,8 +3435,7 @@ class Test_Unequip_1(unittest.TestCase):
         self.scale_mail = self.command_processor.game_state.items_state.get('Scale_Mail')
         self.shield = self.command_processor.game_state.items_state.get('Steel_Shield')
         self.studded_leather = self.command_processor.game_state.items_state.get('Studded_Leather')
-        self.command_processor.game_state.character_name = 'Niath'
-        self.command_processor.game_state.character_class = 'Warrior'
+        self.command_processor.game_state.start_character('Niath', 'Warrior')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.pick_up_item(self.mace)
         self.command_processor.game_state.character.pick_up_item(self.studded_leather)
@@ -3602,8 +3517,7 @@ class Test_Unequip_2(unittest.TestCase):
         self.command_processor = advg.Command_Processor(self.game_state)
         self.staff = self.command_processor.game_state.items_state.get('Staff')
         self.magic_wand = self.command_processor.game_state.items_state.get('Magic_Wand')
-        self.command_processor.game_state.character_name = 'Mialee'
-        self.command_processor.game_state.character_class = 'Mage'
+        self.command_processor.game_state.start_character('Mialee', 'Mage')
         self.game_state.game_has_begun = True
         self.command_processor.game_state.character.pick_up_item(self.staff)
         self.command_processor.game_state.character.pick_up_item(self.magic_wand)
@@ -3645,8 +3559,7 @@ class Test_Unlock(unittest.TestCase):
         self.game_state = advg.Game_State(self.rooms_state, self.creatures_state, self.containers_state,
                                          self.doors_state, self.items_state)
         self.command_processor = advg.Command_Processor(self.game_state)
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
 
         self.door = self.command_processor.game_state.rooms_state.cursor.north_door
@@ -3696,7 +3609,7 @@ class Test_Unlock(unittest.TestCase):
         self.assertEqual(result[0].target, self.door_title)
         self.assertEqual(result[0].message, f'You have unlocked the {self.door_title}.')
         self.assertFalse(self.door.is_locked)
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
 
         result = self.command_processor.process(f'unlock south door')
         self.assertIsInstance(result[0], advg.Unlock_Command_Element_Is_Already_Unlocked)
@@ -3760,7 +3673,7 @@ class Test_Unlock(unittest.TestCase):
 
     def test_unlock_11(self):
         result = self.command_processor.process('pick lock on north door')
-        self.command_processor.game_state.rooms_state.move(north=True)
+        self.command_processor.game_state.rooms_state.move('north')
         result = self.command_processor.process('unlock east doorway')
         self.assertIsInstance(result[0], advg.Unlock_Command_Element_Not_Unlockable)
         self.assertEqual(result[0].target_title, 'east doorway')
@@ -3768,8 +3681,7 @@ class Test_Unlock(unittest.TestCase):
         self.assertEqual(result[0].message, "You can't unlock the east doorway; doorways are not unlockable.")
 
     def test_unlock_12(self):
-        self.command_processor.game_state.character_name = 'Lidda'
-        self.command_processor.game_state.character_class = 'Thief'
+        self.command_processor.game_state.start_character('Lidda', 'Thief')
         self.game_state.game_has_begun = True
         studded_leather_armor = self.items_state.get('Studded_Leather')
         self.command_processor.game_state.character.pick_up_item(studded_leather_armor)
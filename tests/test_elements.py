@@ -4,18 +4,11 @@ import math
 import operator
 import unittest
 
-import iniconfig
-
 from .context import adventuregame as advg
+from .context import containers_ini_config, creatures_ini_config, doors_ini_config, items_ini_config, rooms_ini_config
 
 __name__ = 'tests.test_game_elements'
 
-containers_ini_config = iniconfig.IniConfig('./testing_data/containers.ini')
-items_ini_config = iniconfig.IniConfig('./testing_data/items.ini')
-doors_ini_config = iniconfig.IniConfig('./testing_data/doors.ini')
-creatures_ini_config = iniconfig.IniConfig('./testing_data/creatures.ini')
-rooms_ini_config = iniconfig.IniConfig('./testing_data/rooms.ini')
-
 
 class Test_Container(unittest.TestCase):
 
@@ -55,6 +48,19 @@ class Test_Character(unittest.TestCase):
     def setUp(self):
         self.items_state = advg.Items_State(**items_ini_config.sections)
 
+    def test_ability_scores_and_equipment_are_read_only(self):
+        character = advg.Character('Regdar', 'Warrior', strength=15, dexterity=12, constitution=14, intelligence=10,
+                                   wisdom=10, charisma=8)
+        with self.assertRaises(AttributeError):
+            character.strength = 18
+        with self.assertRaises(AttributeError):
+            character.strength_mod = 4
+        with self.assertRaises(AttributeError):
+            character.weapon = self.items_state.get('Longsword')
+        character.ability_scores.strength = 18
+        self.assertEqual(character.strength, 18)
+        self.assertEqual(character.strength_mod, 4)
+
     def test_attack_and_damage_rolls_1(self):
         character = advg.Character('Regdar', 'Warrior')
         self.assertEqual(character.character_name, 'Regdar')
@@ -91,6 +97,12 @@ class Test_Character(unittest.TestCase):
         self.assertFalse(character.armor_equipped)
         self.assertFalse(character.shield_equipped)
         self.assertFalse(character.weapon_equipped)
+        self.assertIsNone(character.attack_roll)
+        self.assertIsNone(character.damage_roll)
+        character.equip_weapon(longsword)
+        character.ability_scores.strength = 16
+        self.assertEqual(character.attack_roll, '1d20+3')
+        self.assertEqual(character.damage_roll, '1d8+3')
 
     def test_attack_and_damage_rolls_2(self):
         character = advg.Character('Mialee', 'Mage')
@@ -116,6 +128,17 @@ class Test_Character(unittest.TestCase):
         character.unequip_wand()
         self.assertFalse(character.wand_equipped)
 
+    def test_attack_and_damage_rolls_3(self):
+        character = advg.Character('Lidda', 'Thief', strength=10, dexterity=16, constitution=12, intelligence=10,
+                                   wisdom=10, charisma=10)
+        character.character_class = ''.join(['Th', 'ief'])
+        rapier = self.items_state.get('Rapier')
+        character.pick_up_item(rapier)
+        character.equip_weapon(rapier)
+        self.assertEqual(character.attack_roll, '1d20+3')
+        self.assertEqual(character.damage_roll, '1d8+3')
+        self.assertEqual(character.attack_bonus, 3)
+
     def test_pickup_vs_drop_vs_list(self):
         character = advg.Character('Regdar', 'Warrior')
         longsword = self.items_state.get('Longsword')
@@ -255,6 +278,18 @@ class Test_Creature(unittest.TestCase):
         self.assertEqual(kobold.weapon_equipped, short_sword)
         self.assertEqual(kobold.armor_equipped, small_leather_armor)
 
+    def test_creatures_state_lazy_construction(self):
+        self.assertTrue(self.creatures_state.contains('Kobold_Trysk'))
+        kobold = self.creatures_state.get('Kobold_Trysk')
+        self.assertIsInstance(kobold, advg.Creature)
+        self.assertIs(self.creatures_state.get('Kobold_Trysk'), kobold)
+        self.assertIs(self.creatures_state.try_get('Kobold_Trysk'), kobold)
+        self.assertIsNone(self.creatures_state.try_get('Nonexistent_Creature'))
+        creatures = tuple(self.creatures_state.values())
+        self.assertEqual(len(creatures), self.creatures_state.size())
+        self.assertTrue(all(isinstance(creature, advg.Creature) for creature in creatures))
+        self.assertIn(kobold, creatures)
+
     def test_creature_const_2(self):
         sorcerer = self.creatures_state.get('Sorcerer_Ardren')
         self.assertEqual(sorcerer.magic_key_stat, 'charisma')
@@ -281,16 +316,16 @@ class Test_Equipment(unittest.TestCase):
 
     def test_equipment_1(self):
         equipment = advg.Equipment('Warrior')
-        self.assertFalse(equipment.weapon_equipped)
-        self.assertFalse(equipment.armor_equipped)
-        self.assertFalse(equipment.shield_equipped)
-        self.assertFalse(equipment.wand_equipped)
+        self.assertFalse(equipment.weapon)
+        self.assertFalse(equipment.armor)
+        self.assertFalse(equipment.shield)
+        self.assertFalse(equipment.wand)
         equipment.equip_armor(self.items_state.get('Scale_Mail'))
         equipment.equip_shield(self.items_state.get('Steel_Shield'))
         equipment.equip_weapon(self.items_state.get('Magic_Sword'))
-        self.assertTrue(equipment.armor_equipped)
-        self.assertTrue(equipment.shield_equipped)
-        self.assertTrue(equipment.weapon_equipped)
+        self.assertTrue(equipment.armor)
+        self.assertTrue(equipment.shield)
+        self.assertTrue(equipment.weapon)
         with self.assertRaises(advg.Internal_Exception):
             equipment.equip_armor(self.items_state.get('Steel_Shield'))
         self.assertEqual(equipment.armor_class, 16)
@@ -299,17 +334,17 @@ class Test_Equipment(unittest.TestCase):
         equipment.unequip_armor()
         equipment.unequip_shield()
         equipment.unequip_weapon()
-        self.assertFalse(equipment.armor_equipped)
-        self.assertFalse(equipment.shield_equipped)
-        self.assertFalse(equipment.weapon_equipped)
+        self.assertFalse(equipment.armor)
+        self.assertFalse(equipment.shield)
+        self.assertFalse(equipment.weapon)
 
     def test_equipment_2(self):
         equipment = advg.Equipment('Mage')
-        self.assertFalse(equipment.wand_equipped)
+        self.assertFalse(equipment.wand)
         equipment.equip_wand(self.items_state.get('Magic_Wand'))
-        self.assertTrue(equipment.wand_equipped)
+        self.assertTrue(equipment.wand)
         equipment.unequip_wand()
-        self.assertFalse(equipment.wand_equipped)
+        self.assertFalse(equipment.wand)
 
 
 class Test_Ability_Scores(unittest.TestCase):
@@ -322,6 +357,12 @@ class Test_Ability_Scores(unittest.TestCase):
         with self.assertRaises(advg.Internal_Exception):
             advg.Ability_Scores('Ranger')
 
+    def test_ability_scores_init_modifiers(self):
+        ability_scores = advg.Ability_Scores('Warrior')
+        self.assertEqual(ability_scores.strength, 0)
+        self.assertEqual(ability_scores.strength_mod, -5)
+        self.assertEqual(ability_scores.charisma_mod, -5)
+
     def test_roll_stats(self):
         ability_scores = advg.Ability_Scores('Warrior')
         ability_scores.roll_stats()
@@ -362,6 +403,18 @@ class Test_Ability_Scores(unittest.TestCase):
                                 ability_scores.charisma, ability_scores.wisdom)
         self.assertNotEqual(first_stat_roll, second_stat_roll)
 
+    def test_stat_mods_follow_scores(self):
+        ability_scores = advg.Ability_Scores('Warrior')
+        ability_scores.strength = 16
+        ability_scores.dexterity = 9
+        self.assertEqual(ability_scores.strength_mod, 3)
+        self.assertEqual(ability_scores.dexterity_mod, -1)
+        ability_scores.strength = 11
+        self.assertEqual(ability_scores.strength_mod, 0)
+        for score in range(1, 21):
+            ability_scores.wisdom = score
+            self.assertEqual(ability_scores.wisdom_mod, math.floor((score - 10) / 2))
+
 
 class Test_Inventory(unittest.TestCase):
 
@@ -389,8 +442,13 @@ class Test_Inventory(unittest.TestCase):
             self.inventory.remove_one('Longsword')
         with self.assertRaises(KeyError):
             self.inventory.delete('Longsword')
+        with self.assertRaises(advg.Internal_Exception):
+            self.inventory.require('Longsword')
+        self.assertEqual(self.inventory.qty_of('Longsword'), 0)
         self.inventory.set('Longsword', 1, longsword)
+        self.assertEqual(self.inventory.qty_of('Longsword'), 1)
         self.assertTrue(self.inventory.contains(longsword.internal_name))
+        self.assertIs(self.inventory.require('Longsword'), longsword)
         self.assertEqual(set(self.inventory.keys()), {'Longsword', 'Rapier', 'Buckler', 'Heavy_Mace', 'Staff',
                                                           'Warhammer', 'Door_Key', 'Chest_Key', 'Studded_Leather',
                                                           'Scale_Mail', 'Magic_Sword', 'Dagger', 'Gold_Coin',
@@ -458,19 +516,19 @@ class Test_Door_and_Doors_State(unittest.TestCase):
         self.doors_state = advg.Doors_State(**doors_ini_config.sections)
 
     def test_doors_state(self):
-        doors_state_keys = self.doors_state.keys()
+        doors_state_keys = list(self.doors_state.keys())
         self.assertEqual(doors_state_keys, [('Room_1,1', 'Room_1,2'), ('Room_1,1', 'Room_2,1'),
                                             ('Room_1,2', 'Room_2,2'), ('Room_2,1', 'Room_2,2'),
-                                            ('Room_2,2', 'Exit')])
-        doors_state_values = self.doors_state.values()
+                                            ('Exit', 'Room_2,2')])
+        doors_state_values = list(self.doors_state.values())
         self.assertTrue(all(isinstance(door, advg.Door) and isinstance(door, (advg.Wooden_Door, advg.Iron_Door, advg.Doorway))
                             for door in doors_state_values))
-        doors_state_items = self.doors_state.items()
+        doors_state_items = list(self.doors_state.items())
         self.assertEqual(list(map(operator.itemgetter(0, 1), doors_state_items)), [('Room_1,1', 'Room_1,2'),
                                                                                    ('Room_1,1', 'Room_2,1'),
                                                                                    ('Room_1,2', 'Room_2,2'),
                                                                                    ('Room_2,1', 'Room_2,2'),
-                                                                                   ('Room_2,2', 'Exit')])
+                                                                                   ('Exit', 'Room_2,2')])
         self.assertTrue(all(isinstance(door, advg.Door) and isinstance(door, (advg.Wooden_Door, advg.Iron_Door, advg.Doorway))
                             for door in doors_state_values))
         self.assertEqual(self.doors_state.size(), 5)
@@ -519,6 +577,16 @@ class Test_Door_and_Doors_State(unittest.TestCase):
         door_copy = door.copy()
         self.assertIsInstance(door_copy, advg.Iron_Door)
 
+    def test_doors_state_and_door_3(self):
+        doors_dict_of_dicts = {door_internal_name: dict(door_dict) for door_internal_name, door_dict
+                               in doors_ini_config.sections.items()}
+        doors_dict_of_dicts['Room_1,1_x_Room_1,2']['is_locked'] = 'TRUE'
+        doors_dict_of_dicts['Room_1,1_x_Room_1,2']['is_closed'] = 'FALSE'
+        doors_state = advg.Doors_State(**doors_dict_of_dicts)
+        door = doors_state.get('Room_1,1', 'Room_1,2')
+        self.assertIs(door.is_locked, True)
+        self.assertIs(door.is_closed, False)
+
 
 class Test_Item_and_Items_State(unittest.TestCase):
 
@@ -567,7 +635,9 @@ class Test_Item_and_Items_State(unittest.TestCase):
             self.items_state.get('Longsword')
         with self.assertRaises(KeyError):
             self.items_state.delete('Longsword')
+        self.assertIsNone(self.items_state.try_get('Longsword'))
         self.items_state.set('Longsword', longsword)
+        self.assertIs(self.items_state.try_get('Longsword'), longsword)
         self.assertTrue(self.items_state.contains(longsword.internal_name))
         self.assertEqual(set(self.items_state.keys()), {'Buckler', 'Longsword', 'Rapier', 'Heavy_Mace', 'Staff',
                                                         'Warhammer', 'Studded_Leather', 'Door_Key', 'Chest_Key',
@@ -646,14 +716,42 @@ class Test_Rooms_State_Obj(unittest.TestCase):
         self.assertTrue(self.rooms_state.cursor.east_door.closable, True)
         self.assertFalse(self.rooms_state.cursor.has_south_door)
         self.assertFalse(self.rooms_state.cursor.has_west_door)
-        self.rooms_state.move(north=True)
+        self.rooms_state.move('north')
+
+    def test_rooms_state_init_requires_one_entrance(self):
+        rooms_dict_of_dicts = {room_internal_name: dict(room_dict, is_entrance='false')
+                               for room_internal_name, room_dict in rooms_ini_config.sections.items()}
+        with self.assertRaises(advg.Internal_Exception):
+            advg.Rooms_State(self.creatures_state, self.containers_state, self.doors_state, self.items_state,
+                             **rooms_dict_of_dicts)
+        rooms_dict_of_dicts['Room_1,1']['is_entrance'] = 'true'
+        rooms_dict_of_dicts['Room_1,2']['is_entrance'] = 'true'
+        with self.assertRaises(advg.Internal_Exception):
+            advg.Rooms_State(self.creatures_state, self.containers_state, self.doors_state, self.items_state,
+                             **rooms_dict_of_dicts)
+        rooms_dict_of_dicts['Room_1,2']['is_entrance'] = '0'
+        rooms_dict_of_dicts['Room_1,1']['is_entrance'] = 'TRUE'
+        rooms_state = advg.Rooms_State(self.creatures_state, self.containers_state, self.doors_state,
+                                       self.items_state, **rooms_dict_of_dicts)
+        self.assertEqual(rooms_state.cursor.internal_name, 'Room_1,1')
+        self.assertIs(rooms_state.cursor.is_entrance, True)
+
+    def test_rooms_state_empty_door_value(self):
+        rooms_dict_of_dicts = {room_internal_name: dict(room_dict)
+                               for room_internal_name, room_dict in rooms_ini_config.sections.items()}
+        rooms_dict_of_dicts['Room_1,1']['south_door'] = ''
+        rooms_state = advg.Rooms_State(self.creatures_state, self.containers_state, self.doors_state,
+                                       self.items_state, **rooms_dict_of_dicts)
+        self.assertIsNone(rooms_state.cursor.south_door)
+        self.assertFalse(rooms_state.cursor.has_south_door)
+        self.assertEqual(len(rooms_state.cursor.doors), 2)
 
     def test_rooms_state_move_east(self):
         self.rooms_state.cursor.east_door.is_locked = False
-        self.rooms_state.move(east=True)
+        self.rooms_state.move('east')
         self.assertEqual(self.rooms_state.cursor.internal_name, 'Room_2,1')
-        self.assertFalse(self.rooms_state.cursor.is_entrance)
-        self.assertFalse(self.rooms_state.cursor.is_exit)
+        self.assertIs(self.rooms_state.cursor.is_entrance, False)
+        self.assertIs(self.rooms_state.cursor.is_exit, False)
         self.assertEqual(self.rooms_state.cursor.title, 'southeast dungeon room')
         self.assertEqual(self.rooms_state.cursor.description, 'Nondescript room.')
         self.assertTrue(self.rooms_state.cursor.has_north_door)
@@ -662,7 +760,7 @@ class Test_Rooms_State_Obj(unittest.TestCase):
         self.assertTrue(self.rooms_state.cursor.has_west_door)
 
     def test_rooms_state_move_north(self):
-        self.rooms_state.move(north=True)
+        self.rooms_state.move('north')
         self.assertEqual(self.rooms_state.cursor.internal_name, 'Room_1,2')
         self.assertFalse(self.rooms_state.cursor.is_entrance)
         self.assertFalse(self.rooms_state.cursor.is_exit)
@@ -675,8 +773,8 @@ class Test_Rooms_State_Obj(unittest.TestCase):
 
     def test_rooms_state_move_north_and_east(self):
         self.rooms_state.cursor.east_door.is_locked = False
-        self.rooms_state.move(north=True)
-        self.rooms_state.move(east=True)
+        self.rooms_state.move('north')
+        self.rooms_state.move('east')
         self.assertTrue(self.rooms_state.cursor.west_door.title, 'west doorway')
         self.assertTrue(self.rooms_state.cursor.west_door.description, 'This door is bound in iron plates with a '
                                                                            'small barred window set up high.')
@@ -696,7 +794,9 @@ class Test_Rooms_State_Obj(unittest.TestCase):
 
     def test_rooms_state_invalid_move(self):
         with self.assertRaises(advg.Bad_Command_Exception):
-            self.rooms_state.move(south=True)
+            self.rooms_state.move('south')
+        with self.assertRaises(advg.Internal_Exception):
+            self.rooms_state.move('up')
 
     def test_rooms_state_room_items_container_creature_here(self):
         kobold = self.creatures_state.get('Kobold_Trysk')
@@ -742,8 +842,7 @@ class Test_Game_State(unittest.TestCase):
         self.assertIs(self.game_state.character_name, None)
         self.assertIs(self.game_state.character_class, None)
         self.assertIs(getattr(self.game_state, 'character', None), None)
-        self.game_state.character_name = 'Kaeva'
-        self.game_state.character_class = 'Priest'
+        self.game_state.start_character('Kaeva', 'Priest')
         self.game_state.game_has_begun = True
         self.assertEqual(self.game_state.character_name, 'Kaeva')
         self.assertEqual(self.game_state.character_class, 'Priest')